@@ -8,17 +8,39 @@ Username: chuey008
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
-# Imports are used to show a timestamp of the health events and records and typing to do checks within Health
-from datetime import date
-from typing import List
+# Imports are used to show a timestamp of the health events and records, built in generics are used for type hints
+# instead of typing to keep startup fast
+# bisect is used to keep the health records sorted by date and to find date ranges with a binary search
+# threading is used to lock changes to an animal's health state when used from many threads
+import threading
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import date, datetime
+from events import bus, HealthRecordAdded, TreatmentCleared, TreatmentFlagged
 
 class HealthRecord:
+    # __slots__ removes the per-instance __dict__, names are mangled the same way as the private attributes
+    __slots__ = ("__description", "__reported_on", "__severity", "__treatment_notes")
+
     def __init__(self, description, reported_on, severity, treatment_notes):
         """
         This class represents a health record in an animal if there is an event.
         All are private to enforce encapsulation and checks to see the validity of HealthRecords to prevent invalid
         records from being entered.
         """
+        self.__validate_init(description, reported_on, severity, treatment_notes)
+
+        # ensuring internal fields are private
+        self.__description = description
+        self.__reported_on = reported_on
+        self.__severity = severity
+        self.__treatment_notes = treatment_notes
+
+    @staticmethod
+    def __validate_init(description, reported_on, severity, treatment_notes):
+        """
+        Internal validator shared by the constructor and validate_rows.
+        """
         if not isinstance(description, str) or not description.strip():
             raise ValueError("Description cannot be an empty string.")
         if not isinstance(reported_on, date):
@@ -28,12 +50,6 @@ class HealthRecord:
         if not isinstance(treatment_notes, str):
             raise ValueError("Treatment notes must be a string.")
 
-        # ensuring internal fields are private
-        self.__description = description
-        self.__reported_on = reported_on
-        self.__severity = severity
-        self.__treatment_notes = treatment_notes
-
     # using @property decorator to transform a method into a getter
     @property
     def description(self):
@@ -55,13 +71,224 @@ class HealthRecord:
         # notes about the treatment or follow up, could be empty if not severe
         return self.__treatment_notes
 
+    @classmethod
+    def _restore(cls, description, reported_on, severity, treatment_notes, trusted=False):
+        """
+        Rebuild a HealthRecord loaded by the persistence layer.
+        Untrusted data goes through the normal constructor checks, trusted data skips them
+        and is built by from_trusted_rows.
+        """
+        if not trusted:
+            return cls(description, reported_on, severity, treatment_notes)
+        return cls.from_trusted_rows(((description, reported_on, severity, treatment_notes),))[0]
+
+    # --------------------------- Bulk Construction ---------------------------
+    @classmethod
+    def validate_rows(cls, rows):
+        """
+        Checks every (description, reported_on, severity, treatment_notes) row in one pass.
+        Returns a list of (row index, error message) for every bad row, empty if all are valid.
+        """
+        return _row_errors(cls.__validate_init, rows)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds HealthRecords from untrusted rows, every row is checked before any record is built.
+        Raises a ValueError listing all the bad rows at once.
+        """
+        rows = list(rows)
+        _raise_row_errors(cls.validate_rows(rows), "health record")
+        return cls.from_trusted_rows(rows)
+
+    @classmethod
+    def from_trusted_rows(cls, rows):
+        """
+        Builds HealthRecords from already validated rows without any checks, e.g. data this program wrote.
+        The fields are set in the loop to avoid a call per row, _restore(trusted=True) builds through here too
+        so this is the only place outside __init__ that sets them up.
+        """
+        new = cls.__new__
+        records = []
+        for description, reported_on, severity, treatment_notes in rows:
+            record = new(cls)
+            record.__description = description
+            record.__reported_on = reported_on
+            record.__severity = severity
+            record.__treatment_notes = treatment_notes
+            records.append(record)
+        return records
+
+    @classmethod
+    def from_trusted_columns(cls, descriptions, dates, severities, treatment_notes):
+        """
+        Builds HealthRecords from already validated columns of equal length, e.g. lists or arrays.
+        """
+        return cls.from_trusted_rows(zip(descriptions, dates, severities, treatment_notes))
+
     def __repr__(self):
         # represents a string for debugging and tests
         return (f"Date = {self.__reported_on.isoformat()}\n "
                 f"Severity = {self.__severity}\n"
                 f" Description = {self.__description}")
 
+def _row_errors(validate, rows):
+    """
+    Runs a class's static __validate_init over every row and returns [(row index, error message), ...]
+    for the bad ones.
+    """
+    errors = []
+    for i, row in enumerate(rows):
+        try:
+            validate(*row)
+        except (ValueError, TypeError) as e:
+            errors.append((i, str(e)))
+    return errors
+
+def _raise_row_errors(errors, label):
+    """
+    Raises one ValueError describing every bad row, does nothing if there are none.
+    """
+    if errors:
+        details = "; ".join(f"row {i}: {message}" for i, message in errors)
+        raise ValueError(f"{len(errors)} invalid {label} rows - {details}")
+
+def format_animal_summary(name, species, age, diet, under_treatment):
+    """
+    Formats the summary used by Animal.__str__ from plain values, so reports can be rendered from a snapshot.
+    """
+    status = "Undergoing treatment" if under_treatment else "Healthy"
+    return (f"{name} is part of the {species} species\n"
+            f"Age: {age}\n"
+            f"Diet: {diet}\n"
+            f"Health: {status}\n")
+
+# a fixed pool of locks shared between animals (lock striping), so each animal doesn't need its own lock object
+_LOCK_STRIPES = 64
+_locks = [threading.RLock() for _ in range(_LOCK_STRIPES)]
+
+def _lock_for(animal):
+    # the lock that guards an animal's health records and treatment flag
+    return _locks[(id(animal) >> 4) % _LOCK_STRIPES]
+
+def _as_date(value):
+    # records may be stamped with a datetime, records are ordered and filtered by the day only
+    return value.date() if isinstance(value, datetime) else value
+
+def _reported_on(record):
+    # sort key for health records, kept at module level so bisect does not build a new function each call
+    return _as_date(record.report_on)
+
+# records per chunk of a RecordSnapshot
+_SNAPSHOT_CHUNK = 64
+
+class RecordSnapshot(Sequence):
+    """
+    Immutable point-in-time copy of an animal's sorted health records, returned by Animal.records_snapshot.
+    Records are held in a tuple of chunk tuples and chunks that did not change are shared with the previous
+    snapshot, so a snapshot taken after an append only builds the last chunk.
+    version is the animal's version when the snapshot was taken.
+    """
+    __slots__ = ("__chunks", "__len", "__version")
+
+    def __init__(self, chunks, length, version):
+        self.__chunks = chunks
+        self.__len = length
+        self.__version = version
+
+    @property
+    def version(self):
+        # the animal's version when this snapshot was taken
+        return self.__version
+
+    def __len__(self):
+        return self.__len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(self.__len)[index])
+        if index < 0:
+            index += self.__len
+        if not 0 <= index < self.__len:
+            raise IndexError("record index out of range")
+        return self.__chunks[index // _SNAPSHOT_CHUNK][index % _SNAPSHOT_CHUNK]
+
+    def __iter__(self):
+        for chunk in self.__chunks:
+            yield from chunk
+
+    def iter_range(self, lo, hi):
+        """
+        Iterates the records from index lo up to but not including hi a chunk at a time.
+        """
+        chunk_index, offset = divmod(lo, _SNAPSHOT_CHUNK)
+        remaining = min(hi, self.__len) - lo
+        while remaining > 0:
+            chunk = self.__chunks[chunk_index]
+            end = min(len(chunk), offset + remaining)
+            for i in range(offset, end):
+                yield chunk[i]
+            remaining -= end - offset
+            chunk_index += 1
+            offset = 0
+
+    def __repr__(self):
+        return repr(list(self))
+
+class HealthRecordView(Sequence):
+    """
+    Read-only view over a date range of an animal's sorted health records, returned by get_health_records.
+    The view reads a RecordSnapshot, so records added after the view was made never show up in it or shift it.
+    Iterating walks the range and skips records below min_severity.
+    """
+    __slots__ = ("__records", "__lo", "__hi", "__min_severity", "__filtered")
+
+    def __init__(self, records, lo, hi, min_severity=None):
+        self.__records = records
+        self.__lo = lo
+        self.__hi = hi
+        self.__min_severity = min_severity
+        self.__filtered = None  # records above min_severity, only built if indexed
+
+    def __iter__(self):
+        records = self.__records.iter_range(self.__lo, self.__hi)
+        if self.__min_severity is None:
+            yield from records
+        else:
+            for record in records:
+                if record.severity >= self.__min_severity:
+                    yield record
+
+    def __filtered_records(self):
+        """
+        Private helper to build the records that pass min_severity the first time they are indexed.
+        """
+        if self.__filtered is None:
+            self.__filtered = tuple(self.__iter__())
+        return self.__filtered
+
+    def __len__(self):
+        if self.__min_severity is None:
+            return self.__hi - self.__lo
+        return len(self.__filtered_records())
+
+    def __getitem__(self, index):
+        if self.__min_severity is not None:
+            return self.__filtered_records()[index]
+        if isinstance(index, slice):
+            return [self.__records[i] for i in range(self.__lo, self.__hi)[index]]
+        return self.__records[range(self.__lo, self.__hi)[index]]
+
+    def __repr__(self):
+        # matches the list representation that get_health_records used to return
+        return repr(list(self))
+
 class Animal:
+    # __slots__ removes the per-instance __dict__, subclasses declare empty __slots__ to keep the saving
+    # the last three slots hold the snapshot cache and add 24 bytes per animal
+    __slots__ = ("__name", "__species", "__age", "__diet", "__health_records", "__under_treatment",
+                 "__record_store", "__version", "__record_chunks", "__snapshot")
+
     def __init__(self, name, species, age, diet):
         """
         Initialise an Animal object with name, species, age and dietary attributes.
@@ -74,11 +301,16 @@ class Animal:
         self.__species = species.lower()
         self.__age = age
         self.__diet = diet
-        self.__health_records: List[HealthRecord] = []
+        self.__health_records: list[HealthRecord] = []
         self.__under_treatment = False
+        self.__record_store = None  # optional columnar HealthRecordStore mirroring the records
+        self.__version = 0  # bumped each time a health record is added
+        self.__record_chunks = None  # chunk tuples still valid for the next snapshot, created on first snapshot
+        self.__snapshot = None  # cached RecordSnapshot of the current version
 
     # --------------------------- Private Helpers ---------------------------
-    def __validate_init(self, name, species, age, diet):
+    @staticmethod
+    def __validate_init(name, species, age, diet):
         """
         Internal validator to ensure that what is entered is actually what should be entered.
         Completes internal checks.
@@ -164,39 +396,205 @@ class Animal:
     def __add_health_record_private(self, record: HealthRecord):
         """
         Private helper to store the health record and update the treatment flag.
+        Records are kept sorted by the date reported, a record dated before the latest one is inserted in place.
         For any animal that has a severity of greater than 5 will undergo treatment.
         All records will still be saved and stored after it is cleared.
         """
-        self.__health_records.append(record)
-        if record.severity >= 5:
-            self.__under_treatment = True
+        with _lock_for(self):
+            records = self.__health_records
+            day = _reported_on(record)
+            if not records or _reported_on(records[-1]) <= day:
+                position = len(records)
+                records.append(record)
+            else:
+                position = bisect_right(records, day, key=_reported_on)
+                records.insert(position, record)
+            self.__changed(position)
+            if self.__record_store is not None:
+                self.__record_store.append(self, record)
+            if record.severity >= 5:
+                self.__under_treatment = True
+            if bus.active:
+                bus.emit(HealthRecordAdded(self, record))
 
-    def get_health_records(self):
+    def __changed(self, position):
         """
-        Returns a shallow copy of health records to prevent any changes.
-        Will be used for testing as the internal list can't be changed.
+        Private helper to bump the version after a record is stored at position.
+        The cached snapshot is dropped and only the chunks from position onwards have to be built again.
         """
-        return list(self.__health_records)
+        self.__version += 1
+        self.__snapshot = None
+        if self.__record_chunks:
+            del self.__record_chunks[position // _SNAPSHOT_CHUNK:]
+
+    @property
+    def version(self):
+        # number of health records added since the animal was created or loaded
+        return self.__version
+
+    def records_snapshot(self):
+        """
+        Returns an immutable RecordSnapshot of the health records sorted by date.
+        Reading an unchanged animal again returns the same cached snapshot, after a change only the chunks
+        from the changed record onwards are copied and the earlier chunks are shared.
+        """
+        with _lock_for(self):
+            snapshot = self.__snapshot
+            if snapshot is None:
+                records = self.__health_records
+                chunks = self.__record_chunks
+                if chunks is None:
+                    chunks = self.__record_chunks = []
+                for start in range(len(chunks) * _SNAPSHOT_CHUNK, len(records), _SNAPSHOT_CHUNK):
+                    chunks.append(tuple(records[start:start + _SNAPSHOT_CHUNK]))
+                snapshot = self.__snapshot = RecordSnapshot(tuple(chunks), len(records), self.__version)
+            return snapshot
+
+    def get_health_records(self, since=None, until=None, min_severity=None):
+        """
+        Returns a read-only HealthRecordView of the health records sorted by date over records_snapshot(),
+        so the view stays consistent while more records are added.
+        since and until are inclusive dates found with a binary search, min_severity filters lazily.
+        Records and bounds stamped with a datetime are compared by their day.
+        Any argument left as None does not filter.
+        """
+        if since is not None and not isinstance(since, date):
+            raise ValueError("since must be a date.")
+        if until is not None and not isinstance(until, date):
+            raise ValueError("until must be a date.")
+        if min_severity is not None and not isinstance(min_severity, int):
+            raise ValueError("min_severity must be an integer.")
+        with _lock_for(self):
+            # the bounds are searched in the live list while it matches the snapshot
+            snapshot = self.records_snapshot()
+            records = self.__health_records
+            lo = 0 if since is None else bisect_left(records, _as_date(since), key=_reported_on)
+            hi = len(records) if until is None else bisect_right(records, _as_date(until), key=_reported_on)
+        return HealthRecordView(snapshot, lo, max(lo, hi), min_severity)
+
+    def latest_record(self):
+        """
+        Returns the most recently dated health record, or None if there are no records.
+        """
+        return self.__health_records[-1] if self.__health_records else None
+
+    def attach_record_store(self, store):
+        """
+        Attach a columnar HealthRecordStore so zoo-wide analytics can run without walking every animal.
+        Existing records are copied into the store and every record added after is appended to it as well.
+        The store mirrors the records for analytics, the animal still keeps and reads its own records.
+        """
+        with _lock_for(self):
+            if self.__record_store is store:
+                return
+            if self.__record_store is not None:
+                raise ValueError("animal is already attached to a record store.")
+            store.register(self)
+            for record in self.__health_records:
+                store.append(self, record)
+            self.__record_store = store
 
     def clear_treatment(self):
         """
         This will clear the animal after they have received treatment.
         Health records will still be saved to make sure the animal is recovering
         """
-        self.__under_treatment = False
+        with _lock_for(self):
+            self.__under_treatment = False
+            if bus.active:
+                bus.emit(TreatmentCleared(self))
+
+    def flag_treatment(self):
+        """
+        Puts the animal under treatment without adding a health record, used by triage sweeps
+        that decide from the records already stored.
+        """
+        with _lock_for(self):
+            self.__under_treatment = True
+            if bus.active:
+                bus.emit(TreatmentFlagged(self))
+
+    # --------------------------- Persistence Helpers ---------------------------
+    @classmethod
+    def _restore(cls, name, species, age, diet, records=(), under_treatment=False, trusted=False):
+        """
+        Rebuild an Animal (or subclass) loaded by the persistence layer, records must already be sorted by date.
+        Untrusted data goes through __validate_init and add_health_record, trusted data skips every check
+        and is built by from_trusted_rows.
+        The saved under_treatment flag is restored last as it may have been cleared after the records.
+        """
+        if trusted:
+            return cls.from_trusted_rows(((name, species, age, diet, records, under_treatment),))[0]
+        if not isinstance(under_treatment, bool):
+            raise ValueError("under_treatment must be a boolean.")
+        animal = cls(name, species, age, diet)
+        for record in records:
+            animal.add_health_record(record)
+        animal.__under_treatment = under_treatment
+        return animal
+
+    # --------------------------- Bulk Construction ---------------------------
+    @classmethod
+    def validate_rows(cls, rows):
+        """
+        Checks every (name, species, age, diet) row in one pass.
+        Returns a list of (row index, error message) for every bad row, empty if all are valid.
+        """
+        return _row_errors(cls.__validate_init, rows)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds animals of this class from untrusted (name, species, age, diet) rows.
+        Every row is checked before any animal is built, a ValueError lists all the bad rows at once.
+        """
+        rows = list(rows)
+        _raise_row_errors(cls.validate_rows(rows), "animal")
+        return cls.from_trusted_rows((name, species.lower(), age, diet) for name, species, age, diet in rows)
+
+    @classmethod
+    def from_trusted_rows(cls, rows):
+        """
+        Builds animals of this class from already validated rows without any checks.
+        Each row holds the _restore arguments: (name, species, age, diet[, records[, under_treatment]]),
+        species must already be lower case and records sorted by date.
+        The fields are set in the loop to avoid a call per row, _restore(trusted=True) builds through here too
+        so this is the only place outside __init__ that sets them up.
+        """
+        new = cls.__new__
+        animals = []
+        for row in rows:
+            animal = new(cls)
+            animal.__name = row[0]
+            animal.__species = row[1]
+            animal.__age = row[2]
+            animal.__diet = row[3]
+            animal.__health_records = list(row[4]) if len(row) > 4 else []
+            animal.__under_treatment = row[5] if len(row) > 5 else False
+            animal.__record_store = None
+            animal.__version = 0
+            animal.__record_chunks = None
+            animal.__snapshot = None
+            animals.append(animal)
+        return animals
+
+    @classmethod
+    def from_trusted_columns(cls, names, species, ages, diets):
+        """
+        Builds animals of this class from already validated columns of equal length, e.g. lists or arrays.
+        """
+        return cls.from_trusted_rows(zip(names, species, ages, diets))
 
     def __str__(self):
         """
         A summary of the animal on their health for testing and showcasing output.
         """
-        status = "Undergoing treatment" if self.__under_treatment else "Healthy"
-        return (f"{self.__name} is part of the {self.__species} species\n"
-                f"Age: {self.__age}\n"
-                f"Diet: {self.__diet}\n"
-                f"Health: {status}\n")
+        return format_animal_summary(self.__name, self.__species, self.__age, self.__diet, self.__under_treatment)
 
 # --------------------------- Animal Subclasses ---------------------------
 class Mammal(Animal):
+    __slots__ = ()
+
     def __init__(self, name, species, age, diet):
         """
         Subclasses need to inherit properly from parent class Animal, using super().__init__() to call HealthRecords.
@@ -211,6 +609,8 @@ class Mammal(Animal):
         return f"{self.name} the {self.species} makes a typical mammal sound."
 
 class Reptile(Animal):
+    __slots__ = ()
+
     def __init__(self, name, species, age, diet):
         """
         Subclasses need to inherit properly from parent class Animal, using super().__init__() to call HealthRecords.
@@ -225,6 +625,8 @@ class Reptile(Animal):
         return f"{self.name} the {self.species} makes a typical reptile sound."
 
 class Bird(Animal):
+    __slots__ = ()
+
     def __init__(self, name, species, age, diet):
         """
         Subclasses need to inherit properly from parent class Animal, using super().__init__() to call HealthRecords.
@@ -239,6 +641,8 @@ class Bird(Animal):
         return f"{self.name} the {self.species} makes a typical bird sound."
 
 class Other(Animal):
+    __slots__ = ()
+
     def __init__(self, name, species, age, diet):
         """
         Subclasses need to inherit properly from parent class Animal, using super().__init__() to call HealthRecords.
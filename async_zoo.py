@@ -0,0 +1,109 @@
+'''
+File: async_zoo.py
+Description: This class AsyncZoo file wraps a Zoo with an asyncio API, so an async service can call the zoo
+operations from one event loop without pushing them into executor threads.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing asyncio for handing control back to the event loop.
+persistence is imported by save_jsonl when it is first used.
+"""
+import asyncio
+from zoo import Zoo
+
+# how many rows, report lines or placement groups to process before letting other tasks on the event loop run
+YIELD_EVERY = 500
+
+class AsyncZoo:
+    """
+    This class represents an asyncio facade over a Zoo.
+    The zoo operations are quick and run on the event loop thread itself, no executors are used.
+    No locks are needed: every zoo call is synchronous, so another task can only run at an await, and there
+    is never an await part way through a call. Each operation is therefore atomic with respect to other tasks
+    on the loop, e.g. a bulk placement into one enclosure is a single Zoo.place_animals call.
+    Long running operations hand control back to the event loop regularly, only between whole zoo calls.
+    """
+    def __init__(self, zoo):
+        if not isinstance(zoo, Zoo):
+            raise TypeError("zoo must be a Zoo instance.")
+        self.__zoo = zoo
+
+    # --------------------------- Public Properties ---------------------------
+    @property
+    def zoo(self):
+        # the wrapped Zoo, for synchronous lookups
+        return self.__zoo
+
+    # --------------------------- Operations ---------------------------
+    async def place_animal(self, animal_name, enclosure_name):
+        """
+        Delegates a placement to Zoo.place_animal.
+        """
+        self.__zoo.place_animal(animal_name, enclosure_name)
+
+    async def remove_from_enclosure(self, animal_name):
+        """
+        Delegates taking an animal out of its enclosure to Zoo.remove_from_enclosure.
+        """
+        return self.__zoo.remove_from_enclosure(animal_name)
+
+    async def perform_health_check(self, staff_id, animal_name, description, severity, treatment_notes=""):
+        """
+        Delegates a health check to Zoo.perform_health_check.
+        """
+        return self.__zoo.perform_health_check(staff_id, animal_name, description, severity, treatment_notes)
+
+    async def clean_enclosure(self, staff_id, enclosure_name):
+        """
+        Delegates a staff member cleaning an enclosure to Zoo.clean_enclosure.
+        """
+        return self.__zoo.clean_enclosure(staff_id, enclosure_name)
+
+    # --------------------------- Bulk Pipeline ---------------------------
+    async def place_many(self, placements):
+        """
+        Bulk placement pipeline, placements is an iterable of (animal name, enclosure name).
+        Requests are grouped by enclosure and each group is placed with one all-or-nothing Zoo.place_animals call,
+        handing control back to the event loop between groups.
+        Returns {enclosure name: add_animals report, or the error message if the group could not be placed}.
+        """
+        groups = {}
+        for animal_name, enclosure_name in placements:
+            groups.setdefault(enclosure_name, []).append(animal_name)
+        results = {}
+        for i, (enclosure_name, animal_names) in enumerate(groups.items(), 1):
+            try:
+                results[enclosure_name] = self.__zoo.place_animals(animal_names, enclosure_name)
+            except ValueError as e:
+                results[enclosure_name] = str(e)
+            if i % YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+        return results
+
+    # --------------------------- Persistence and Reporting ---------------------------
+    async def save_jsonl(self, path):
+        """
+        Save the zoo as JSON Lines like persistence.save_jsonl, yielding to the event loop while writing.
+        The rows are all built before the first await, so the file is one consistent picture of the zoo even if
+        other tasks change it during the save.
+        """
+        from persistence import iter_rows, _write_jsonl_row
+        rows = list(iter_rows(self.__zoo))
+        with open(path, "w", encoding="utf-8") as f:
+            for i, row in enumerate(rows, 1):
+                _write_jsonl_row(f, row)
+                if i % YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+
+    async def report(self):
+        """
+        Async generator of Enclosure.report_status for every enclosure, in registration order.
+        """
+        for i, enclosure in enumerate(self.__zoo.enclosures(), 1):
+            yield enclosure.report_status()
+            if i % YIELD_EVERY == 0:
+                await asyncio.sleep(0)
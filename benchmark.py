@@ -0,0 +1,606 @@
+'''
+File: benchmark.py
+Description: This benchmark file measures the cost of the core zoo classes so changes can be compared before and
+after. Run directly with python benchmark.py to print the results, or python benchmark.py suite to run the
+reproducible suite and write a JSON results file that can be compared between versions.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing tracemalloc to measure memory allocated per instance.
+Importing time.perf_counter to time the operations.
+Importing random to build repeatable synthetic data.
+Importing sys and threading to hammer shared objects from many threads.
+Importing datetime.date and timedelta to stamp the health records created for the benchmark.
+Importing argparse, json and platform for the command line, the results file and its metadata.
+Importing compileall, os and subprocess to time imports in a fresh interpreter with python -X importtime.
+Importing asyncio and tempfile to save a zoo from AsyncZoo while another task changes it.
+"""
+import argparse
+import asyncio
+import compileall
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import tracemalloc
+from datetime import date, datetime, timedelta
+from time import perf_counter
+import async_zoo
+from animal import HealthRecord, Mammal
+from health_store import HealthRecordStore
+from enclosure import CLEANLINESS_PER_ANIMAL, Enclosure, EnvironmentType, SPECIES_KEYWORDS
+from events import BUFFERED, SYNC, bus
+from persistence import iter_rows, load_jsonl
+from placement import plan_placements
+from reporting import generate_report
+from staff import Staff
+from triage import plan_triage
+from zoo import Zoo
+
+# --------------------------- Dict-backed Baselines ---------------------------
+class _DictHealthRecord:
+    """
+    Baseline copy of HealthRecord without __slots__, used to show the footprint before the change.
+    """
+    def __init__(self, description, reported_on, severity, treatment_notes):
+        self.__description = description
+        self.__reported_on = reported_on
+        self.__severity = severity
+        self.__treatment_notes = treatment_notes
+
+class _DictAnimal:
+    """
+    Baseline copy of Animal without __slots__, used to show the footprint before the change.
+    """
+    def __init__(self, name, species, age, diet):
+        self.__name = name
+        self.__species = species.lower()
+        self.__age = age
+        self.__diet = diet
+        self.__health_records = []
+        self.__under_treatment = False
+
+# --------------------------- Memory Benchmarks ---------------------------
+def _bytes_per_instance(factory, count):
+    """
+    Private helper to measure the average number of bytes allocated by factory(i) over count instances.
+    Strings and dates are shared between instances so only the object itself is measured.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # remove the cost of the list holding the objects
+    return (after - before - objects.__sizeof__()) / count
+
+def bench_memory_footprint(count=100_000):
+    """
+    Compares the per-instance footprint of the dict-backed and __slots__ based classes.
+    Returns a dictionary of {name: bytes per instance}.
+    """
+    today = date.today()
+    results = {
+        "health_record_dict": _bytes_per_instance(
+            lambda i: _DictHealthRecord("checkup", today, 3, ""), count),
+        "health_record_slots": _bytes_per_instance(
+            lambda i: HealthRecord("checkup", today, 3, ""), count),
+        "animal_dict": _bytes_per_instance(
+            lambda i: _DictAnimal("Ellie", "elephant", 5, "Herbivore"), count),
+        "animal_slots": _bytes_per_instance(
+            lambda i: Mammal("Ellie", "elephant", 5, "Herbivore"), count),
+    }
+    return results
+
+# --------------------------- Placement Benchmarks ---------------------------
+def bench_placement(n_animals=5_000, n_enclosures=500, seed=0):
+    """
+    Times plan_placements in greedy and exact mode on the same synthetic zoo.
+    Returns a dictionary of {mode: (seconds, animals placed)}.
+    """
+    rng = random.Random(seed)
+    species = [k for keywords in SPECIES_KEYWORDS.values() for k in keywords]
+    animals = [Mammal(f"animal-{i}", rng.choice(species), rng.randint(0, 30), "Omnivore") for i in range(n_animals)]
+    environments = list(EnvironmentType)
+    enclosures = [Enclosure(f"enclosure-{i}", 100.0, environments[i % len(environments)], rng.randint(2, 20))
+                  for i in range(n_enclosures)]
+    results = {}
+    for mode in ("greedy", "exact"):
+        start = perf_counter()
+        plan = plan_placements(animals, enclosures, mode)
+        results[mode] = (perf_counter() - start, len(plan["assignments"]))
+    return results
+
+# --------------------------- Report Benchmarks ---------------------------
+def bench_report_scaling(n_enclosures=2_000, animals_per_enclosure=20, worker_counts=(1, 2, 4, 8)):
+    """
+    Times generate_report on one synthetic zoo with different numbers of worker processes.
+    Checks every run gives the same report. Returns a dictionary of {workers: seconds}.
+    """
+    zoo = Zoo("benchmark")
+    for e in range(n_enclosures):
+        enclosure = Enclosure(f"enclosure-{e}", 500.0, EnvironmentType.TEMPERATE, animals_per_enclosure)
+        animals = [Mammal(f"animal-{e}-{i}", "zebra", i, "Herbivore") for i in range(animals_per_enclosure)]
+        for animal in animals:
+            zoo.add_animal(animal)
+        enclosure.add_animals(animals)
+        zoo.add_enclosure(enclosure)
+    results = {}
+    expected = None
+    for workers in worker_counts:
+        start = perf_counter()
+        report = generate_report(zoo, workers=workers)
+        results[workers] = perf_counter() - start
+        if expected is None:
+            expected = report
+        assert report == expected, "parallel report differs from the serial report"
+    return results
+
+# --------------------------- Concurrency Stress Test ---------------------------
+def bench_concurrent_placement(threads=16, per_thread=2_000, capacity=10_000):
+    """
+    Many threads add distinct animals to one enclosure and health records to one shared animal at the same time.
+    Checks the invariants afterwards and raises AssertionError if any were broken:
+        - the enclosure never holds more than its capacity and holds exactly the successful placements
+        - the cleanliness matches the number of animals added
+        - every health record was kept and the treatment flag was set
+    Returns a dictionary with the elapsed seconds and placement counts.
+    """
+    enclosure = Enclosure("stress", 1_000.0, EnvironmentType.TEMPERATE, capacity)
+    shared = Mammal("Shared", "elephant", 10, "Herbivore")
+    today = date.today()
+    placed = [0] * threads
+    start_line = threading.Barrier(threads)
+
+    def worker(t):
+        animals = [Mammal(f"animal-{t}-{i}", "zebra", 1, "Herbivore") for i in range(per_thread)]
+        start_line.wait()
+        for i, animal in enumerate(animals):
+            try:
+                enclosure.add_animal(animal)
+                placed[t] += 1
+            except ValueError:
+                pass
+            shared.add_health_record(HealthRecord("checkup", today, 5 if i == 0 else 1, ""))
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible to expose races
+    try:
+        start = perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = perf_counter() - start
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    total = sum(placed)
+    occupancy = enclosure.occupancy
+    assert occupancy <= capacity, "enclosure was overfilled"
+    assert occupancy == total == min(capacity, threads * per_thread), "placements were lost"
+    assert enclosure.cleanliness == max(0, 100 - CLEANLINESS_PER_ANIMAL * total), "cleanliness drifted"
+    assert len(shared.get_health_records()) == threads * per_thread, "health records were lost"
+    assert shared.under_treatment, "treatment flag was lost"
+    return {"seconds": elapsed, "attempted": threads * per_thread, "placed": total}
+
+def bench_async_save(n_animals=2_000, placements=200):
+    """
+    AsyncZoo.save_jsonl runs while another task adds and places new animals, with the writer yielding after
+    every row so the two are interleaved as much as possible.
+    Reloads the file afterwards and raises AssertionError if it can't be loaded or doesn't match the zoo
+    as it was when the save started.
+    Returns a dictionary with the elapsed seconds, rows written and placements made during the save.
+    """
+    zoo = generate_zoo(n_animals)
+    enclosure = Enclosure("async", 1_000.0, EnvironmentType.TEMPERATE, placements)
+    zoo.add_enclosure(enclosure)
+    expected = list(iter_rows(zoo))
+    facade = async_zoo.AsyncZoo(zoo)
+
+    async def place():
+        for i in range(placements):
+            zoo.add_animal(Mammal(f"late-{i}", "zebra", 1, "Herbivore"))
+            await facade.place_animal(f"late-{i}", "async")
+            await asyncio.sleep(0)
+
+    async def run(path):
+        await asyncio.gather(facade.save_jsonl(path), place())
+
+    yield_every = async_zoo.YIELD_EVERY
+    async_zoo.YIELD_EVERY = 1
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "zoo.jsonl")
+            start = perf_counter()
+            asyncio.run(run(path))
+            elapsed = perf_counter() - start
+            saved = list(iter_rows(load_jsonl(path)))
+    finally:
+        async_zoo.YIELD_EVERY = yield_every
+
+    assert enclosure.occupancy == placements, "placements were lost"
+    assert saved == expected, "saved file does not match the zoo when the save started"
+    return {"seconds": elapsed, "rows": len(saved), "placed_during_save": placements}
+
+# --------------------------- Event Bus Benchmarks ---------------------------
+def bench_event_overhead(n=200_000):
+    """
+    Times n add_animal/remove_animal pairs and n clean calls with the event bus:
+        - idle: nobody is subscribed so only the active flag is read
+        - sync: one no-op handler called straight away
+        - buffered: one no-op batch handler called every 1000 events
+    Returns a dictionary of {mode: nanoseconds per operation}.
+    """
+    enclosure = Enclosure("events", 100.0, EnvironmentType.TEMPERATE, 10)
+    animal = Mammal("Zed", "zebra", 3, "Herbivore")
+
+    def run():
+        start = perf_counter()
+        for _ in range(n):
+            enclosure.add_animal(animal)
+            enclosure.remove_animal("Zed")
+            enclosure.clean()
+        return (perf_counter() - start) / (3 * n) * 1e9
+
+    def handler(event):
+        pass
+
+    results = {"idle": run()}
+    bus.subscribe(handler)
+    results["sync"] = run()
+    bus.unsubscribe(handler)
+    bus.set_mode(BUFFERED, batch_size=1000)
+    bus.subscribe_batch(handler)
+    results["buffered"] = run()
+    bus.unsubscribe(handler)
+    bus.set_mode(SYNC)
+    return results
+
+# --------------------------- Synthetic Data ---------------------------
+def generate_animals(n, seed=0):
+    """
+    Returns n Mammals with unique names and species drawn from SPECIES_KEYWORDS, the same for the same seed.
+    """
+    rng = random.Random(seed)
+    species = [k for keywords in SPECIES_KEYWORDS.values() for k in keywords]
+    return [Mammal(f"animal-{i}", rng.choice(species), rng.randint(0, 40), "Omnivore") for i in range(n)]
+
+def generate_records(n, seed=0, start=date(2020, 1, 1)):
+    """
+    Returns n HealthRecords dated over the days after start, mostly in order with about 1 in 20 back-dated.
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        day = i // 10 - (rng.randint(1, 30) if rng.random() < 0.05 else 0)
+        records.append(HealthRecord("checkup", start + timedelta(days=max(day, 0)), rng.randint(1, 4), ""))
+    return records
+
+def generate_zoo(n_animals, per_enclosure=20, seed=0):
+    """
+    Returns a Zoo with n_animals zebras placed in temperate enclosures of per_enclosure animals,
+    one Zookeeper and one Veterinarian assigned to everything.
+    """
+    zoo = Zoo("benchmark")
+    zoo.add_staff(Staff("K001", "Keeper", "Zookeeper"))
+    zoo.add_staff(Staff("V001", "Vet", "Veterinarian"))
+    rng = random.Random(seed)
+    for e in range(0, n_animals, per_enclosure):
+        enclosure = Enclosure(f"enclosure-{e // per_enclosure}", 500.0, EnvironmentType.TEMPERATE, per_enclosure)
+        animals = [Mammal(f"animal-{i}", "zebra", rng.randint(0, 40), "Herbivore")
+                   for i in range(e, min(e + per_enclosure, n_animals))]
+        for animal in animals:
+            zoo.add_animal(animal)
+        enclosure.add_animals(animals)
+        zoo.add_enclosure(enclosure)
+    return zoo
+
+# --------------------------- Benchmark Suite ---------------------------
+"""
+Each suite benchmark takes the number of entities n and returns {metric: nanoseconds per operation},
+so results for different sizes and versions can be compared directly.
+"""
+def _ns_per_op(seconds, ops):
+    # average nanoseconds per operation
+    return seconds / max(ops, 1) * 1e9
+
+def suite_animal_construction(n):
+    """
+    Times building n valid animals one at a time, n rejected rows going through the validation checks,
+    and the same valid rows built in bulk with and without validation.
+    """
+    rows = [(f"animal-{i}", "zebra", i % 40, "Herbivore") for i in range(n)]
+    bad = [(f"animal-{i}", "zebra", -1, "Herbivore") for i in range(n)]
+    start = perf_counter()
+    for row in rows:
+        Mammal(*row)
+    construct = perf_counter() - start
+    start = perf_counter()
+    for row in bad:
+        try:
+            Mammal(*row)
+        except ValueError:
+            pass
+    reject = perf_counter() - start
+    start = perf_counter()
+    Mammal.from_rows(rows)
+    validated = perf_counter() - start
+    start = perf_counter()
+    Mammal.from_trusted_rows(rows)
+    trusted = perf_counter() - start
+    return {"construct": _ns_per_op(construct, n), "reject": _ns_per_op(reject, n),
+            "from_rows": _ns_per_op(validated, n), "from_trusted_rows": _ns_per_op(trusted, n)}
+
+def suite_enclosure_churn(n):
+    """
+    Times adding n animals to one enclosure with room for all of them and then removing them by name.
+    """
+    animals = [Mammal(f"animal-{i}", "zebra", 1, "Herbivore") for i in range(n)]
+    enclosure = Enclosure("churn", 1_000.0, EnvironmentType.TEMPERATE, n)
+    start = perf_counter()
+    for animal in animals:
+        enclosure.add_animal(animal)
+    add = perf_counter() - start
+    start = perf_counter()
+    for animal in animals:
+        enclosure.remove_animal(animal.name)
+    remove = perf_counter() - start
+    return {"add_animal": _ns_per_op(add, n), "remove_animal": _ns_per_op(remove, n)}
+
+def suite_health_records(n, per_animal=100):
+    """
+    Times adding n health records spread over n / per_animal animals, then one date range query and a full
+    read of each animal's records.
+    """
+    animals = generate_animals(max(n // per_animal, 1))
+    records = generate_records(n)
+    start = perf_counter()
+    for i, record in enumerate(records):
+        animals[i % len(animals)].add_health_record(record)
+    insert = perf_counter() - start
+    since, until = date(2020, 2, 1), date(2020, 3, 1)
+    start = perf_counter()
+    for animal in animals:
+        list(animal.get_health_records(since, until))
+    query = perf_counter() - start
+    start = perf_counter()
+    for animal in animals:
+        list(animal.get_health_records())
+    read = perf_counter() - start
+    return {"add_health_record": _ns_per_op(insert, n),
+            "query_range": _ns_per_op(query, len(animals)),
+            "read_all": _ns_per_op(read, len(animals))}
+
+def suite_staff_actions(n):
+    """
+    Times n feeds and n health checks over a pool of animals and n enclosure cleans.
+    """
+    animals = generate_animals(min(n, 10_000))
+    enclosure = Enclosure("clean", 100.0, EnvironmentType.TEMPERATE, 1)
+    keeper = Staff("K001", "Keeper", "Zookeeper")
+    vet = Staff("V001", "Vet", "Veterinarian")
+    start = perf_counter()
+    for i in range(n):
+        keeper.feed_animal(animals[i % len(animals)], "hay")
+    feed = perf_counter() - start
+    start = perf_counter()
+    for i in range(n):
+        vet.perform_health_check(animals[i % len(animals)], "checkup", 2)
+    check = perf_counter() - start
+    start = perf_counter()
+    for _ in range(n):
+        keeper.clean_enclosure(enclosure)
+    clean = perf_counter() - start
+    return {"feed_animal": _ns_per_op(feed, n), "health_check": _ns_per_op(check, n),
+            "clean_enclosure": _ns_per_op(clean, n)}
+
+def suite_report_rendering(n):
+    """
+    Times rendering the full report of a zoo with n animals in this process, per animal.
+    """
+    zoo = generate_zoo(n)
+    start = perf_counter()
+    generate_report(zoo, workers=1)
+    return {"generate_report": _ns_per_op(perf_counter() - start, n)}
+
+def suite_triage(n, per_animal=5):
+    """
+    Times planning a triage sweep over n animals with per_animal records each, reading each animal's own records
+    and reading the columns of a HealthRecordStore.
+    """
+    animals = generate_animals(n)
+    store = HealthRecordStore()
+    records = generate_records(n * per_animal)
+    for i, record in enumerate(records):
+        animals[i % n].add_health_record(record)
+    today = records[-1].report_on
+    start = perf_counter()
+    plan_triage(animals, 30, 4, today)
+    scan = perf_counter() - start
+    for animal in animals:
+        animal.attach_record_store(store)
+    start = perf_counter()
+    plan_triage(animals, 30, 4, today, store)
+    columns = perf_counter() - start
+    return {"per_animal_records": _ns_per_op(scan, n), "record_store": _ns_per_op(columns, n)}
+
+SUITE = {
+    "animal_construction": suite_animal_construction,
+    "enclosure_churn": suite_enclosure_churn,
+    "health_records": suite_health_records,
+    "staff_actions": suite_staff_actions,
+    "report_rendering": suite_report_rendering,
+    "triage": suite_triage,
+}
+
+def run_suite(sizes=(1_000, 10_000, 100_000), names=None):
+    """
+    Runs the suite benchmarks named in names (all of them if None) at every size.
+    Returns a JSON serialisable dictionary:
+        {"meta": {...}, "results": {benchmark: {size: {metric: ns per op}}}}
+    """
+    names = list(SUITE) if names is None else names
+    for name in names:
+        if name not in SUITE:
+            raise ValueError(f"unknown benchmark {name!r}, expected one of {tuple(SUITE)}.")
+    results = {}
+    for name in names:
+        # sizes are kept as strings so the results survive a round trip through JSON unchanged
+        results[name] = {str(size): SUITE[name](size) for size in sizes}
+    meta = {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "machine": platform.machine(), "created": datetime.now().isoformat(timespec="seconds")}
+    return {"meta": meta, "results": results}
+
+def compare_results(old, new, tolerance=0.10):
+    """
+    Compares two run_suite results and returns a list of (benchmark, size, metric, old ns, new ns, ratio,
+    regressed) for every metric present in both, sorted slowest change first.
+    regressed is True when the ratio is above 1 + tolerance.
+    """
+    rows = []
+    for name, sizes in new["results"].items():
+        for size, metrics in sizes.items():
+            before = old["results"].get(name, {}).get(size, {})
+            for metric, value in metrics.items():
+                if metric in before and before[metric] > 0:
+                    ratio = value / before[metric]
+                    rows.append((name, size, metric, before[metric], value, ratio, ratio > 1 + tolerance))
+    rows.sort(key=lambda row: row[5], reverse=True)
+    return rows
+
+# --------------------------- Startup Benchmarks ---------------------------
+# import time budget in milliseconds for each core module, including everything it imports
+STARTUP_BUDGET_MS = {"animal": 20.0, "enclosure": 25.0, "staff": 20.0}
+# slow modules that importing the core modules must not pull in, they are imported on first use instead
+STARTUP_FORBIDDEN = ("typing", "re", "json", "numpy", "concurrent.futures", "persistence", "reporting")
+
+def bench_import_time(modules=tuple(STARTUP_BUDGET_MS), repeat=5):
+    """
+    Imports each module in a fresh interpreter repeat times with python -X importtime.
+    The sources are compiled first so every run loads cached bytecode, the best run is kept to limit noise.
+    Returns {module: (milliseconds, [forbidden modules it imported])}.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    compileall.compile_dir(here, maxlevels=0, quiet=1)
+    check = f"import sys; print(' '.join(m for m in {STARTUP_FORBIDDEN!r} if m in sys.modules))"
+    results = {}
+    for module in modules:
+        best = None
+        for _ in range(repeat):
+            run = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}; {check}"],
+                                 cwd=here, capture_output=True, text=True, check=True)
+            # the last line of the report is the module itself: "import time: self | cumulative | name"
+            line = [ln for ln in run.stderr.splitlines() if ln.rstrip().endswith(f"| {module}")][-1]
+            micros = int(line.split("|")[1])
+            best = micros if best is None else min(best, micros)
+        results[module] = (best / 1000, run.stdout.split())
+    return results
+
+def check_startup(results, budget=STARTUP_BUDGET_MS):
+    """
+    Checks bench_import_time results, returns a list of problems.
+    Empty if every module imports within its budget without a forbidden import.
+    """
+    problems = []
+    for module, (ms, forbidden) in results.items():
+        if ms > budget[module]:
+            problems.append(f"{module} took {ms:.1f} ms to import, the budget is {budget[module]:.1f} ms")
+        if forbidden:
+            problems.append(f"{module} imported {', '.join(forbidden)} at startup")
+    return problems
+
+def _print_classic():
+    """
+    Prints the original set of benchmarks.
+    """
+    print("Memory footprint (bytes per instance):")
+    for name, value in bench_memory_footprint().items():
+        print(f"  {name:<22} {value:8.1f}")
+    print("Placement (seconds, animals placed):")
+    for n_animals, n_enclosures in ((1_000, 100), (10_000, 1_000), (50_000, 5_000)):
+        for mode, (seconds, placed) in bench_placement(n_animals, n_enclosures).items():
+            print(f"  {mode:<6} {n_animals:>6} animals x {n_enclosures:>5} enclosures {seconds:8.3f}s {placed:>6}")
+    print("Concurrent placement stress test:")
+    print(f"  {bench_concurrent_placement()}")
+    print("Async save during placement:")
+    print(f"  {bench_async_save()}")
+    print("Report generation (workers: seconds):")
+    for workers, seconds in bench_report_scaling().items():
+        print(f"  {workers:>2} {seconds:8.3f}s")
+    print("Event bus overhead (ns per mutation):")
+    for mode, ns in bench_event_overhead().items():
+        print(f"  {mode:<8} {ns:8.1f}")
+
+def main(argv=None):
+    """
+    Command line entry point, with no command the original benchmarks are printed.
+        suite   run the suite, print it and optionally write it to --output and compare it to --baseline
+        compare compare two results files written by suite
+        startup time importing animal, enclosure and staff against STARTUP_BUDGET_MS
+    Exits with status 1 when a comparison finds a regression or startup is over budget.
+    """
+    parser = argparse.ArgumentParser(description="Zoo benchmarks")
+    commands = parser.add_subparsers(dest="command")
+    suite = commands.add_parser("suite", help="run the benchmark suite")
+    suite.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                       help="entity counts to run at, from 1000 up to 1000000")
+    suite.add_argument("--only", nargs="+", choices=list(SUITE), help="benchmarks to run")
+    suite.add_argument("--output", help="write the results to this JSON file")
+    suite.add_argument("--baseline", help="compare against this JSON results file")
+    suite.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown, 0.10 is 10%%")
+    compare = commands.add_parser("compare", help="compare two results files")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("--tolerance", type=float, default=0.10, help="allowed slowdown, 0.10 is 10%%")
+    startup = commands.add_parser("startup", help="check the import time of the core modules")
+    startup.add_argument("--repeat", type=int, default=5, help="imports per module, the best is kept")
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        _print_classic()
+        return 0
+    if args.command == "startup":
+        results = bench_import_time(repeat=args.repeat)
+        for module, (ms, forbidden) in results.items():
+            print(f"  {module:<10} {ms:8.2f} ms  budget {STARTUP_BUDGET_MS[module]:6.1f} ms  {' '.join(forbidden)}")
+        problems = check_startup(results)
+        for problem in problems:
+            print(f"  OVER BUDGET: {problem}")
+        return 1 if problems else 0
+    if args.command == "suite":
+        new = run_suite(args.sizes, args.only)
+        for name, sizes in new["results"].items():
+            print(f"{name}:")
+            for size, metrics in sizes.items():
+                print(f"  {size:>8} " + "  ".join(f"{m} {ns:10.1f} ns" for m, ns in metrics.items()))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(new, f, indent=2)
+        if not args.baseline:
+            return 0
+        with open(args.baseline, encoding="utf-8") as f:
+            old = json.load(f)
+    else:
+        with open(args.old, encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+    regressions = 0
+    for name, size, metric, before, after, ratio, regressed in compare_results(old, new, args.tolerance):
+        regressions += regressed
+        flag = "REGRESSION" if regressed else ""
+        print(f"  {name:<20} {size:>8} {metric:<18} {before:10.1f} -> {after:10.1f} ns  x{ratio:5.2f} {flag}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+'''
+File: dashboard.py
+Description: This class ZooDashboard file keeps zoo-wide totals (occupancy per environment, average cleanliness and
+animals under treatment) up to date from the mutation events on the event bus, so reading the dashboard never
+scans the zoo.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+class ZooDashboard:
+    """
+    This class represents cached aggregates over enclosures and animals.
+    The last known values of every tracked enclosure and animal are kept, so a refresh after a change only
+    subtracts the old values and adds the new ones.
+    on_event is the event bus handler, it refreshes whichever tracked enclosure or animal an event is about.
+    Reads are O(1), apart from copying the per-environment dictionary which has one entry per EnvironmentType.
+    verify() recomputes everything from scratch to check the cache.
+    """
+    def __init__(self):
+        # enclosure -> (environment, occupancy, cleanliness) when it was last refreshed
+        self.__enclosures: dict[object, tuple[object, int, float]] = {}
+        self.__animals: dict[object, bool] = {}  # animal -> under_treatment
+        self.__occupancy: dict[object, int] = {}
+        self.__capacity: dict[object, int] = {}
+        self.__cleanliness_total = 0.0
+        self.__under_treatment = 0
+
+    # --------------------------- Private Helpers ---------------------------
+    def __apply(self, environment, occupancy, cleanliness, sign):
+        """
+        Private helper to add (sign=1) or subtract (sign=-1) an enclosure's values from the totals.
+        """
+        self.__occupancy[environment] = self.__occupancy.get(environment, 0) + sign * occupancy
+        self.__cleanliness_total += sign * cleanliness
+
+    # --------------------------- Updates ---------------------------
+    def track_enclosure(self, enclosure):
+        """
+        Start tracking an enclosure, or refresh it if it is already tracked.
+        """
+        old = self.__enclosures.get(enclosure)
+        if old is None:
+            env = enclosure.environment
+            self.__capacity[env] = self.__capacity.get(env, 0) + enclosure.capacity
+        else:
+            self.__apply(*old, -1)
+        new = (enclosure.environment, enclosure.occupancy, float(enclosure.cleanliness))
+        self.__apply(*new, 1)
+        self.__enclosures[enclosure] = new
+
+    # refreshing is the same as tracking again, the old values are subtracted first
+    refresh_enclosure = track_enclosure
+
+    def forget_enclosure(self, enclosure):
+        """
+        Stop tracking an enclosure and remove its values from the totals.
+        """
+        old = self.__enclosures.pop(enclosure, None)
+        if old is not None:
+            self.__apply(*old, -1)
+            self.__capacity[enclosure.environment] -= enclosure.capacity
+
+    def track_animal(self, animal):
+        """
+        Start tracking an animal's treatment flag, or refresh it if it is already tracked.
+        """
+        old = self.__animals.get(animal, False)
+        self.__animals[animal] = animal.under_treatment
+        self.__under_treatment += int(animal.under_treatment) - int(old)
+
+    refresh_animal = track_animal
+
+    def forget_animal(self, animal):
+        """
+        Stop tracking an animal.
+        """
+        if self.__animals.pop(animal, False):
+            self.__under_treatment -= 1
+
+    def on_event(self, event):
+        """
+        Event bus handler for the enclosure events (AnimalAdded, AnimalRemoved, EnclosureCleaned, EnclosureDecayed)
+        and the treatment events (HealthRecordAdded, TreatmentCleared, TreatmentFlagged).
+        Events about enclosures or animals that are not tracked are ignored, so many dashboards can share the bus.
+        """
+        enclosure = getattr(event, "enclosure", None)
+        if enclosure is not None:
+            if enclosure in self.__enclosures:
+                self.refresh_enclosure(enclosure)
+        elif event.animal in self.__animals:
+            self.refresh_animal(event.animal)
+
+    # --------------------------- Reads ---------------------------
+    def occupancy_by_environment(self):
+        """
+        Returns {EnvironmentType: (animals housed, total capacity)} for every environment with an enclosure.
+        """
+        return {env: (self.__occupancy.get(env, 0), cap) for env, cap in self.__capacity.items() if cap}
+
+    def average_cleanliness(self):
+        """
+        Returns the average cleanliness of the tracked enclosures, or None if there are none.
+        """
+        if not self.__enclosures:
+            return None
+        return self.__cleanliness_total / len(self.__enclosures)
+
+    def under_treatment_count(self):
+        """
+        Returns how many tracked animals are undergoing treatment.
+        """
+        return self.__under_treatment
+
+    def totals(self):
+        """
+        Returns every aggregate in one dictionary for displaying.
+        """
+        return {"enclosures": len(self.__enclosures),
+                "animals": len(self.__animals),
+                "housed": sum(self.__occupancy.values()),
+                "under_treatment": self.__under_treatment,
+                "average_cleanliness": self.average_cleanliness(),
+                "occupancy_by_environment": self.occupancy_by_environment()}
+
+    # --------------------------- Verification ---------------------------
+    def verify(self, enclosures, animals):
+        """
+        Recomputes the aggregates from scratch for the given enclosures and animals and compares them to the cache.
+        Returns a list of mismatch descriptions, empty if the cache is correct.
+        """
+        fresh = ZooDashboard()
+        for enclosure in enclosures:
+            fresh.track_enclosure(enclosure)
+        for animal in animals:
+            fresh.track_animal(animal)
+        mine, theirs = self.totals(), fresh.totals()
+        mismatches = []
+        for key, value in theirs.items():
+            if key == "average_cleanliness" and value is not None and mine[key] is not None:
+                if abs(value - mine[key]) > 1e-6:
+                    mismatches.append(f"{key}: cached {mine[key]} but actual {value}")
+            elif mine[key] != value:
+                mismatches.append(f"{key}: cached {mine[key]} but actual {value}")
+        return mismatches
@@ -10,11 +10,15 @@ This is my own work as defined by the University's Academic Integrity Policy.
 
 """
 Importing enum.Enum to use to define a closed set of environment types to avoid string typos.
-Importing typing.List used for type hints for lists of Animal.
+Importing threading so each enclosure can lock its check-then-act changes when used from many threads.
+re is only imported the first time the species patterns are compiled, to keep startup fast.
 """
+import threading
 from enum import Enum
-from typing import List
-from animal import Animal
+from animal import Animal, _raise_row_errors, _row_errors
+from errors import (CapacityError, DuplicateError, IncompatibleError, MissingError, RejectedError, Rejection,
+                    TreatmentError)
+from events import bus, AnimalAdded, AnimalRemoved, EnclosureCleaned, EnclosureDecayed
 
 class EnvironmentType(Enum):
     """
@@ -28,6 +32,109 @@ class EnvironmentType(Enum):
     ARCTIC = "arctic"
     TEMPERATE = "temperate"  # general environment that is able to host a wide range of animals
 
+# cleanliness lost each time an animal is added to an enclosure
+CLEANLINESS_PER_ANIMAL = 5.0
+
+# --------------------------- Species Compatibility Registry ---------------------------
+"""
+Registry of species keywords for each environment type.
+Substring based, for additional flexibility - e.g. specific species like "brown bear" and "polar bear"
+Catch-all environments (e.g. TEMPERATE) accept any species and are not in the registry, any other environment only
+accepts species matching its keywords.
+"""
+CATCH_ALL_ENVIRONMENTS = frozenset({EnvironmentType.TEMPERATE})
+
+SPECIES_KEYWORDS: dict[EnvironmentType, tuple[str, ...]] = {
+    EnvironmentType.AQUATIC: ("dolphin", "seal", "penguin", "fish", "sea otter", "turtle"),
+    EnvironmentType.SAVANNAH: ("giraffe", "elephant", "zebra", "ostrich", "red kangaroo", "meerkat"),
+    EnvironmentType.DESERT: ("camel", "scorpion", "dingo", "bearded dragon", "hawk", "cobra"),
+    EnvironmentType.TROPICAL: ("lemur", "green anaconda", "parrot", "gecko", "capybara", "sloth"),
+    EnvironmentType.RAINFOREST: ("tree frog", "toucan", "spider monkey", "harpy eagle", "tiger", "gorilla"),
+    EnvironmentType.ARCTIC: ("polar bear", "arctic fox", "snowy owls", "walrus", "seal", "puffin"),
+}
+
+# (patterns, cache) published together in one assignment, None until the first lookup and after the registry changes
+#   patterns: {EnvironmentType: re.Pattern}, one compiled pattern per environment
+#   cache: {(environment, species): bool} so repeated species resolve in a single lookup
+_compiled = None
+# guards compiling and changing the registry, lookups read _compiled without it
+_compile_lock = threading.Lock()
+
+def _compile_species_patterns():
+    """
+    Private helper to compile the keywords of every environment into one alternation pattern.
+    Longest keywords first so the pattern is deterministic, results are the same as a substring scan.
+    The patterns are built in a local dictionary and only published once complete, with a new empty cache.
+    Returns the published (patterns, cache).
+    """
+    global _compiled
+    with _compile_lock:
+        if _compiled is None:
+            import re
+            patterns = {}
+            for env, keywords in SPECIES_KEYWORDS.items():
+                ordered = sorted(set(keywords), key=len, reverse=True)
+                patterns[env] = re.compile("|".join(re.escape(k) for k in ordered))
+            _compiled = (patterns, {})
+        return _compiled
+
+def register_species_keywords(environment, *keywords):
+    """
+    Register additional species keywords for an environment type without editing the Enclosure class.
+    Keywords are stored in lower case, each one must be a non-empty string.
+    Catch-all environments already accept every species, so registering keywords for them raises a ValueError.
+    """
+    if not isinstance(environment, EnvironmentType):
+        raise TypeError("environment must be a valid EnvironmentType")
+    if environment in CATCH_ALL_ENVIRONMENTS:
+        raise ValueError(f"{environment.value} accepts every species, keywords cannot be registered for it.")
+    if not keywords:
+        raise ValueError("at least one species keyword must be given.")
+    for k in keywords:
+        if not isinstance(k, str) or not k.strip():
+            raise ValueError("species keyword cannot be an empty string.")
+    global _compiled
+    with _compile_lock:
+        existing = SPECIES_KEYWORDS.get(environment, ())
+        new = tuple(k.strip().lower() for k in keywords if k.strip().lower() not in existing)
+        SPECIES_KEYWORDS[environment] = existing + new
+        # lookups already holding the old patterns only write to the old cache, which is dropped here
+        _compiled = None
+
+def is_compatible(environment, species):
+    """
+    Returns True if the species is able to live in the environment type.
+    The first lookup of a species compiles its result, any lookups after are cached.
+    """
+    compiled = _compiled
+    if compiled is None:
+        compiled = _compile_species_patterns()
+    patterns, cache = compiled
+    key = (environment, species)
+    result = cache.get(key)
+    if result is None:
+        if environment in CATCH_ALL_ENVIRONMENTS:
+            result = True
+        else:
+            pattern = patterns.get(environment)
+            result = pattern is not None and pattern.search(species.lower()) is not None
+        cache[key] = result
+    return result
+
+# --------------------------- Report Formatting ---------------------------
+def format_occupant(animal_name, species):
+    """
+    Formats one line of Enclosure.list_animals from plain values.
+    """
+    return f"{animal_name} is a - {species}"
+
+def format_enclosure_status(name, occupancy, capacity, environment_value, cleanliness):
+    """
+    Formats Enclosure.report_status from plain values, so reports can be rendered from a snapshot.
+    """
+    return (f"Enclosure '{name}': {occupancy}/{capacity} animals; "
+            f"Environment: {environment_value}; Cleanliness: {cleanliness}%")
+
 class Enclosure:
     """
     This class represents the physical enclosure in the zoo.
@@ -45,11 +152,16 @@ class Enclosure:
         self.__size_sqm = size_sqm
         self.__environment = environment
         self.__capacity = capacity
-        self.__animals: List[Animal]=[]
+        self.__animals: dict[str, Animal] = {}  # keyed by animal name, keeps insertion order
         self.__cleanliness = 100  # starts fully clean
+        self.__lock = threading.RLock()  # guards the animals and cleanliness between threads
+        self.__version = 0  # bumped each time an animal is added or removed
+        self.__occupants = None  # cached tuple of the animals for the current version
+        self.__listing = None  # cached list_animals strings for the current version
 
     # --------------------------- Private Helpers ---------------------------
-    def __validate_init(self, name, size_sqm, environment, capacity):
+    @staticmethod
+    def __validate_init(name, size_sqm, environment, capacity):
         """
         Internal validator to ensure that what is entered is actually what should be entered.
         Completes internal checks.
@@ -69,30 +181,20 @@ class Enclosure:
         """
         self.__cleanliness = max(0, self.__cleanliness - amount)
 
+    def __changed(self):
+        """
+        Private helper to bump the version after the occupants change and drop the cached snapshots.
+        """
+        self.__version += 1
+        self.__occupants = None
+        self.__listing = None
+
     def __compatible_with_environment(self, animal: Animal):
         """
         Private helper to check if the animal is compatible with the environment type in the enclosure.
-        Method encapsulates the mapping of animal species to environments.
-        Substring based, for additional flexibility - e.g. specific species like "brown bear" and "polar bear"
-        """
-        a_species = animal.species.lower()
-        env = self.__environment
-        if env == EnvironmentType.AQUATIC:
-            return any(i in a_species for i in ("dolphin", "seal", "penguin", "fish", "sea otter", "turtle"))
-        if env == EnvironmentType.SAVANNAH:
-            return any(i in a_species for i in ("giraffe", "elephant", "zebra", "ostrich", "red kangaroo", "meerkat"))
-        if env == EnvironmentType.DESERT:
-            return any(i in a_species for i in ("camel", "scorpion", "dingo", "bearded dragon", "hawk", "cobra"))
-        if env == EnvironmentType.TROPICAL:
-            return any(i in a_species for i in ("lemur", "green anaconda", "parrot", "gecko", "capybara", "sloth"))
-        if env == EnvironmentType.RAINFOREST:
-            return any(i in a_species for i in ("tree frog", "toucan", "spider monkey", "harpy eagle", "tiger", "gorilla"))
-        if env == EnvironmentType.ARCTIC:
-            return any(i in a_species for i in ("polar bear", "arctic fox", "snowy owls", "walrus", "seal", "puffin"))
-        if env == EnvironmentType.TEMPERATE:
-            # temperate accepts generalists type animal species
-            return True
-        return False
+        The mapping of animal species to environments is kept in the SPECIES_KEYWORDS registry above.
+        """
+        return is_compatible(self.__environment, animal.species)
 
     # --------------------------- Public Properties ---------------------------
     @property
@@ -115,6 +217,11 @@ class Enclosure:
         # capacity of the enclosure - having only a maximum number of animals allowed as per the size
         return self.__capacity
 
+    @property
+    def occupancy(self):
+        # number of animals currently in the enclosure
+        return len(self.__animals)
+
     @property
     def cleanliness(self):
         # how clean is the enclosure out of 100
@@ -128,50 +235,259 @@ class Enclosure:
             - animal must not be undergoing treatment
             - enclosure must have free capacity
             - animal must be compatible with the enclosure environment
+            - no other animal with the same name can already be in the enclosure
         Internal checks to validate the above
-        Append the current __animal list
+        Store the animal against its name in the private __animals index
         Reduce the cleanliness of the enclosure due to adding another animal to it
         """
-        if not isinstance(animal, Animal):
-            raise TypeError("animal must be a valid Animal instance.")
-        if animal.under_treatment:
-            raise ValueError("animal undergoing treatment cannot be placed into an enclosure.")
-        if len(self.__animals) >= self.__capacity:
-            raise ValueError("enclosure is at full capacity.")
-        if not self.__compatible_with_environment(animal):
-            raise ValueError(f"{animal.species} is incompatible with {self.__environment.value} environment.")
-        self.__animals.append(animal)
-        self.__reduce_cleanliness(5.0)
+        with self.__lock:
+            if not isinstance(animal, Animal):
+                raise TypeError("animal must be a valid Animal instance.")
+            if animal.under_treatment:
+                raise TreatmentError("animal undergoing treatment cannot be placed into an enclosure.")
+            if len(self.__animals) >= self.__capacity:
+                raise CapacityError("enclosure is at full capacity.")
+            if not self.__compatible_with_environment(animal):
+                raise IncompatibleError(f"{animal.species} is incompatible with "
+                                        f"{self.__environment.value} environment.")
+            if animal.name in self.__animals:
+                raise DuplicateError(f"Animal named {animal.name} is already in enclosure.")
+            self.__animals[animal.name] = animal
+            self.__changed()
+            self.__reduce_cleanliness(CLEANLINESS_PER_ANIMAL)
+            if bus.active:
+                bus.emit(AnimalAdded(self, animal))
+
+    def add_animals(self, animals):
+        """
+        Adding a batch of animals to an enclosure with all-or-nothing semantics.
+        The same conditions as add_animal are checked in one pass over the batch:
+            - environment compatibility is checked once per species
+            - capacity is checked once for the whole batch
+            - names must be unique within the batch and the enclosure
+        If any animal is rejected nothing is added, otherwise all are added and the cleanliness is
+        reduced in one step.
+        Returns a report dictionary rather than raising on the first failure:
+            {"added": [Animal, ...], "rejected": [(animal, reason), ...]}
+        """
+        with self.__lock:
+            batch = list(animals)
+            accepted = []
+            rejected = []
+            species_ok = {}
+            seen = set(self.__animals)
+            for animal in batch:
+                if not isinstance(animal, Animal):
+                    rejected.append((animal, Rejection("animal must be a valid Animal instance.",
+                                                       RejectedError.reason)))
+                    continue
+                if animal.under_treatment:
+                    rejected.append((animal, Rejection("animal undergoing treatment cannot be placed into an "
+                                                       "enclosure.", TreatmentError.reason)))
+                    continue
+                ok = species_ok.get(animal.species)
+                if ok is None:
+                    ok = species_ok[animal.species] = self.__compatible_with_environment(animal)
+                if not ok:
+                    rejected.append((animal, Rejection(f"{animal.species} is incompatible with "
+                                                       f"{self.__environment.value} environment.",
+                                                       IncompatibleError.reason)))
+                    continue
+                if animal.name in seen:
+                    rejected.append((animal, Rejection(f"Animal named {animal.name} is already in enclosure.",
+                                                       DuplicateError.reason)))
+                    continue
+                seen.add(animal.name)
+                accepted.append(animal)
+
+            free = self.__capacity - len(self.__animals)
+            if len(accepted) > free:
+                full = Rejection("enclosure is at full capacity.", CapacityError.reason)
+                rejected.extend((a, full) for a in accepted[max(free, 0):])
+                accepted = accepted[:max(free, 0)]
+
+            if rejected:
+                return {"added": [], "rejected": rejected}
+            for animal in accepted:
+                self.__animals[animal.name] = animal
+            if accepted:
+                self.__changed()
+            self.__reduce_cleanliness(CLEANLINESS_PER_ANIMAL * len(accepted))
+            if bus.active:
+                for animal in accepted:
+                    bus.emit(AnimalAdded(self, animal))
+            return {"added": accepted, "rejected": []}
 
     def remove_animal(self, animal_name):
         """
-        Remove an animal by name and return the removed Animal object from list.
-        Uses the private list to scan and find the animal name, then removes the object.
-        If it doesn't find the animal name in the list, it prints a ValueError.
+        Remove an animal by name and return the removed Animal object.
+        Uses the private name index to find the animal directly, then removes the object.
+        If it doesn't find the animal name in the index, it raises a ValueError.
         """
-        for a in self.__animals:
-            if a.name == animal_name:
-                self.__animals.remove(a)
-                return a
-            raise ValueError(f"Animal named {animal_name} is not found in enclosure.")
+        with self.__lock:
+            try:
+                animal = self.__animals.pop(animal_name)
+            except KeyError:
+                raise MissingError(f"Animal named {animal_name} is not found in enclosure.") from None
+            self.__changed()
+            if bus.active:
+                bus.emit(AnimalRemoved(self, animal))
+            return animal
+
+    def get_animal(self, animal_name):
+        """
+        Returns the Animal object with the given name without removing it.
+        If it doesn't find the animal name in the index, it raises a ValueError.
+        """
+        try:
+            return self.__animals[animal_name]
+        except KeyError:
+            raise MissingError(f"Animal named {animal_name} is not found in enclosure.") from None
+
+    def contains(self, animal_name):
+        """
+        Returns True if an animal with the given name is in the enclosure.
+        """
+        return animal_name in self.__animals
+
+    def animal_names(self):
+        """
+        Returns the names of contained animals in insertion order.
+        """
+        with self.__lock:
+            return list(self.__animals)
+
+    @property
+    def version(self):
+        # number of times animals have been added or removed
+        return self.__version
+
+    def occupants(self):
+        """
+        Returns an immutable tuple of the contained animals in insertion order.
+        Reading an unchanged enclosure again returns the same cached tuple.
+        """
+        with self.__lock:
+            if self.__occupants is None:
+                self.__occupants = tuple(self.__animals.values())
+            return self.__occupants
 
     def list_animals(self):
         """
         Returns a display of contained animals in the enclosure using strings.
+        The strings are only formatted again after the occupants change.
+        """
+        with self.__lock:
+            if self.__listing is None:
+                self.__listing = tuple(format_occupant(a.name, a.species) for a in self.occupants())
+            return list(self.__listing)
+
+    # --------------------------- Persistence Helpers ---------------------------
+    @classmethod
+    def _restore(cls, name, size_sqm, environment, capacity, animals=(), cleanliness=100, trusted=False):
         """
-        return [f"{a.name} is a - {a.species}" for a in self.__animals]
+        Rebuild an Enclosure with its occupants and cleanliness loaded by the persistence layer.
+        Untrusted data goes through __validate_init plus checks on the occupants, trusted data skips every check
+        and is built by from_trusted_rows.
+        Occupants are not checked for treatment as an animal can be treated after it was placed.
+        """
+        if trusted:
+            return cls.from_trusted_rows(((name, size_sqm, environment, capacity, animals, cleanliness),))[0]
+        enclosure = cls(name, size_sqm, environment, capacity)
+        if not isinstance(cleanliness, (int, float)) or not (0 <= cleanliness <= 100):
+            raise ValueError("cleanliness must be a number between 0 and 100.")
+        animals = list(animals)
+        if len(animals) > capacity:
+            raise CapacityError("enclosure is at full capacity.")
+        for animal in animals:
+            if not isinstance(animal, Animal):
+                raise TypeError("animal must be a valid Animal instance.")
+            if not is_compatible(environment, animal.species):
+                raise IncompatibleError(f"{animal.species} is incompatible with {environment.value} environment.")
+        if len({a.name for a in animals}) != len(animals):
+            raise DuplicateError("animal names must be unique within an enclosure.")
+        enclosure.__animals = {a.name: a for a in animals}
+        enclosure.__cleanliness = cleanliness
+        return enclosure
+
+    # --------------------------- Bulk Construction ---------------------------
+    @classmethod
+    def validate_rows(cls, rows):
+        """
+        Checks every (name, size_sqm, environment, capacity) row in one pass.
+        Returns a list of (row index, error message) for every bad row, empty if all are valid.
+        """
+        return _row_errors(cls.__validate_init, rows)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds empty enclosures from untrusted (name, size_sqm, environment, capacity) rows.
+        Every row is checked before any enclosure is built, a ValueError lists all the bad rows at once.
+        """
+        rows = list(rows)
+        _raise_row_errors(cls.validate_rows(rows), "enclosure")
+        return cls.from_trusted_rows(rows)
+
+    @classmethod
+    def from_trusted_rows(cls, rows):
+        """
+        Builds enclosures from already validated rows without any checks.
+        Each row holds the _restore arguments: (name, size_sqm, environment, capacity[, animals[, cleanliness]]).
+        The fields are set in the loop to avoid a call per row, _restore(trusted=True) builds through here too
+        so this is the only place outside __init__ that sets them up.
+        """
+        new = cls.__new__
+        enclosures = []
+        for row in rows:
+            enclosure = new(cls)
+            enclosure.__name = row[0]
+            enclosure.__size_sqm = row[1]
+            enclosure.__environment = row[2]
+            enclosure.__capacity = row[3]
+            enclosure.__animals = {a.name: a for a in row[4]} if len(row) > 4 else {}
+            enclosure.__cleanliness = row[5] if len(row) > 5 else 100
+            enclosure.__lock = threading.RLock()
+            enclosure.__version = 0
+            enclosure.__occupants = None
+            enclosure.__listing = None
+            enclosures.append(enclosure)
+        return enclosures
+
+    @classmethod
+    def from_trusted_columns(cls, names, sizes, environments, capacities):
+        """
+        Builds empty enclosures from already validated columns of equal length.
+        """
+        return cls.from_trusted_rows(zip(names, sizes, environments, capacities))
 
     def report_status(self):
         """
         Returns a summary for reports and testing/demos
         """
-        return (f"Enclosure '{self.__name}': {len(self.__animals)}/{self.__capacity} animals; "
-                f"Environment: {self.__environment.value}; Cleanliness: {self.cleanliness}%")
+        with self.__lock:
+            return format_enclosure_status(self.__name, len(self.__animals), self.__capacity,
+                                           self.__environment.value, self.__cleanliness)
+
+    def decay_cleanliness(self, amount):
+        """
+        Reduces the cleanliness by amount over time, used by the simulation engine.
+        Cleanliness never drops below 0.
+        """
+        with self.__lock:
+            if not isinstance(amount, (int, float)) or amount < 0:
+                raise ValueError("amount must be a non-negative number.")
+            self.__reduce_cleanliness(amount)
+            if bus.active:
+                bus.emit(EnclosureDecayed(self, amount))
 
     def clean(self):
         """
         Cleans the enclosure and restores the cleanliness to 100%.
         Returns a string used by the staff methods to include staff name.
         """
-        self.__cleanliness = 100.0
-        return f"Enclosure: '{self.__name}' cleaned successfully"
\ No newline at end of file
+        with self.__lock:
+            self.__cleanliness = 100.0
+            if bus.active:
+                bus.emit(EnclosureCleaned(self))
+            return f"Enclosure: '{self.__name}' cleaned successfully"
\ No newline at end of file
@@ -0,0 +1,48 @@
+'''
+File: errors.py
+Description: This errors file defines the rejections raised or returned by Animal, Enclosure and Staff. Each one
+carries the reason it was rejected, so callers like the instrumentation never have to read the message text.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+# --------------------------- Raised Errors ---------------------------
+class RejectedError(ValueError):
+    """
+    This class represents an operation that was refused, reason names why e.g. "capacity".
+    They are ValueErrors so existing except ValueError handling keeps working.
+    """
+    reason = "invalid"
+
+class CapacityError(RejectedError):
+    # the enclosure is full
+    reason = "capacity"
+
+class TreatmentError(RejectedError):
+    # the animal is undergoing treatment
+    reason = "treatment"
+
+class IncompatibleError(RejectedError):
+    # the species doesn't suit the enclosure's environment
+    reason = "environment"
+
+class DuplicateError(RejectedError):
+    # the name is already in use
+    reason = "duplicate"
+
+class MissingError(RejectedError):
+    # the animal or enclosure is not there
+    reason = "missing"
+
+# --------------------------- Returned Refusals ---------------------------
+class Rejection(str):
+    """
+    This class represents a refusal that is returned instead of raised, e.g. in an add_animals report or by
+    Staff.feed_animal. It is the plain message string with the reason attached, so it prints and compares as before.
+    """
+    def __new__(cls, message, reason=RejectedError.reason):
+        rejection = super().__new__(cls, message)
+        rejection.reason = reason
+        return rejection
@@ -0,0 +1,160 @@
+'''
+File: events.py
+Description: This class EventBus file lets other parts of the program subscribe to changes in animals, enclosures
+and staff instead of polling them. Events can be delivered straight away or buffered and delivered in batches.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing collections.namedtuple to define small immutable event types.
+"""
+from collections import namedtuple
+
+# --------------------------- Event Types ---------------------------
+AnimalAdded = namedtuple("AnimalAdded", ("enclosure", "animal"))
+AnimalRemoved = namedtuple("AnimalRemoved", ("enclosure", "animal"))
+EnclosureCleaned = namedtuple("EnclosureCleaned", ("enclosure",))
+EnclosureDecayed = namedtuple("EnclosureDecayed", ("enclosure", "amount"))
+HealthRecordAdded = namedtuple("HealthRecordAdded", ("animal", "record"))
+TreatmentCleared = namedtuple("TreatmentCleared", ("animal",))
+TreatmentFlagged = namedtuple("TreatmentFlagged", ("animal",))
+AnimalAssigned = namedtuple("AnimalAssigned", ("staff", "animal_name"))
+AnimalUnassigned = namedtuple("AnimalUnassigned", ("staff", "animal_name"))
+EnclosureAssigned = namedtuple("EnclosureAssigned", ("staff", "enclosure_name"))
+EnclosureUnassigned = namedtuple("EnclosureUnassigned", ("staff", "enclosure_name"))
+
+EVENT_TYPES = (AnimalAdded, AnimalRemoved, EnclosureCleaned, EnclosureDecayed, HealthRecordAdded, TreatmentCleared,
+               TreatmentFlagged, AnimalAssigned, AnimalUnassigned, EnclosureAssigned, EnclosureUnassigned)
+
+# delivery modes
+SYNC = "sync"
+BUFFERED = "buffered"
+
+class EventBus:
+    """
+    This class represents an in-process event bus.
+    Emitters check the public active flag before building an event, so with no subscribers the only cost of an
+    event is reading one attribute.
+    In sync mode handlers run as soon as the event is emitted.
+    In buffered mode events are queued and delivered in order when flush() is called or batch_size is reached,
+    batch handlers receive the whole list at once.
+    """
+    __slots__ = ("active", "__handlers", "__batch_handlers", "__mode", "__batch_size", "__buffer")
+
+    def __init__(self):
+        self.active = False  # True only while there is at least one subscriber
+        self.__handlers = {}  # event type -> [handler, ...], None as the key receives every event
+        self.__batch_handlers = []
+        self.__mode = SYNC
+        self.__batch_size = 1000
+        self.__buffer = []
+
+    # --------------------------- Private Helpers ---------------------------
+    def __update_active(self):
+        """
+        Private helper to keep the active flag in line with the subscribers.
+        """
+        self.active = bool(self.__batch_handlers) or any(self.__handlers.values())
+
+    def __deliver(self, event):
+        """
+        Private helper to call the handlers for one event.
+        """
+        for handler in self.__handlers.get(type(event), ()):
+            handler(event)
+        for handler in self.__handlers.get(None, ()):
+            handler(event)
+
+    # --------------------------- Subscribing ---------------------------
+    def subscribe(self, handler, event_type=None):
+        """
+        Call handler(event) for every event of event_type, or for every event if event_type is None.
+        """
+        if event_type is not None and event_type not in EVENT_TYPES:
+            raise ValueError("event_type must be one of EVENT_TYPES or None.")
+        if not callable(handler):
+            raise TypeError("handler must be callable.")
+        self.__handlers.setdefault(event_type, []).append(handler)
+        self.active = True
+
+    def subscribe_batch(self, handler):
+        """
+        Call handler(events) with each list of buffered events when they are flushed.
+        In sync mode the handler is called with a list of one event.
+        """
+        if not callable(handler):
+            raise TypeError("handler must be callable.")
+        self.__batch_handlers.append(handler)
+        self.active = True
+
+    def unsubscribe(self, handler, event_type=None):
+        """
+        Remove a handler added with subscribe or subscribe_batch.
+        The handler lists are replaced rather than changed in place, so a handler can be removed while an
+        event is being delivered (e.g. by a finalizer) without the delivery skipping another handler.
+        """
+        if handler in self.__batch_handlers:
+            handlers = list(self.__batch_handlers)
+            handlers.remove(handler)
+            self.__batch_handlers = handlers
+        else:
+            handlers = list(self.__handlers.get(event_type, ()))
+            try:
+                handlers.remove(handler)
+            except ValueError:
+                raise ValueError("handler is not subscribed.") from None
+            self.__handlers[event_type] = handlers
+        self.__update_active()
+
+    # --------------------------- Delivery ---------------------------
+    def set_mode(self, mode, batch_size=1000):
+        """
+        Switch between SYNC and BUFFERED delivery, any buffered events are flushed first.
+        """
+        if mode not in (SYNC, BUFFERED):
+            raise ValueError(f"mode must be {SYNC!r} or {BUFFERED!r}.")
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer.")
+        self.flush()
+        self.__mode = mode
+        self.__batch_size = batch_size
+
+    def emit(self, event):
+        """
+        Deliver or buffer an event, emitters should check active first to avoid building unused events.
+        """
+        if self.__mode == SYNC:
+            self.__deliver(event)
+            for handler in self.__batch_handlers:
+                handler([event])
+            return
+        self.__buffer.append(event)
+        if len(self.__buffer) >= self.__batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Deliver every buffered event in the order it was emitted.
+        """
+        if not self.__buffer:
+            return
+        events, self.__buffer = self.__buffer, []
+        for event in events:
+            self.__deliver(event)
+        for handler in self.__batch_handlers:
+            handler(events)
+
+    def clear(self):
+        """
+        Remove every subscriber and drop any buffered events.
+        """
+        self.__handlers.clear()
+        self.__batch_handlers.clear()
+        self.__buffer = []
+        self.active = False
+
+# the bus used by Animal, Enclosure and Staff
+bus = EventBus()
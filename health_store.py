@@ -0,0 +1,242 @@
+'''
+File: health_store.py
+Description: This class HealthRecordStore file keeps health records for the whole zoo in columns, so analytics like
+counts and severity per species can run over plain arrays without creating a HealthRecord object per row.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing array.array to store each column as a compact typed array instead of a list of objects.
+Importing threading to lock appends, as animals on different threads can share one store.
+Importing datetime.date to convert between dates and the stored day ordinals.
+NumPy is optional, when it is installed max_severity_by_animal runs over the columns without copying them.
+It is looked up on first use through the same helper as the simulation, as importing it is slow.
+"""
+import threading
+from array import array
+from datetime import date
+from animal import HealthRecord
+from simulation import _numpy
+
+class HealthRecordStore:
+    """
+    This class represents a columnar store of health records.
+    Each row is split into columns: date ordinal, severity, animal id, description id and treatment notes id.
+    Descriptions, notes and species are interned in a string table so repeated text is only stored once.
+    Animals are given an integer id when they are first seen, with their species stored alongside.
+    The store is a mirror for analytics: attached animals keep their own HealthRecord objects for
+    get_health_records and its snapshots, and the store holds the same rows as 32 bit columns beside them.
+    Each mirrored row costs about 22 bytes on top of the record object, not a second copy of the object.
+    """
+    def __init__(self):
+        # row columns, 32 bit is enough for day ordinals, string ids and animal ids
+        self.__ordinals = array("i")
+        self.__severities = array("b")
+        self.__animal_ids = array("i")
+        self.__description_ids = array("i")
+        self.__notes_ids = array("i")
+
+        # interned strings
+        self.__strings: list[str] = []
+        self.__string_ids: dict[str, int] = {}
+
+        # animal columns, indexed by animal id
+        self.__animals = []
+        self.__animal_id_of: dict[object, int] = {}
+        self.__animal_species = array("i")
+        self.__rows_by_animal: list[array] = []
+        self.__lock = threading.RLock()
+
+    # --------------------------- Private Helpers ---------------------------
+    def __intern(self, text):
+        """
+        Private helper to return the id of a string in the string table, adding it if new.
+        """
+        sid = self.__string_ids.get(text)
+        if sid is None:
+            sid = self.__string_ids[text] = len(self.__strings)
+            self.__strings.append(text)
+        return sid
+
+    def __row_filter(self, since, until, species):
+        """
+        Private helper returning the row numbers that fall in the date range (inclusive) for the species.
+        Any argument left as None does not filter.
+        """
+        lo = since.toordinal() if since is not None else None
+        hi = until.toordinal() if until is not None else None
+        species_id = None
+        if species is not None:
+            species_id = self.__string_ids.get(species.lower())
+            if species_id is None:
+                return []
+        ordinals = self.__ordinals
+        animal_species = self.__animal_species
+        if species_id is not None:
+            # only the rows of animals of that species need to be looked at
+            candidates = [r for aid, sp in enumerate(animal_species) if sp == species_id
+                          for r in self.__rows_by_animal[aid]]
+            candidates.sort()
+        else:
+            candidates = range(len(ordinals))
+        if lo is None and hi is None:
+            return list(candidates)
+        lo = float("-inf") if lo is None else lo
+        hi = float("inf") if hi is None else hi
+        return [r for r in candidates if lo <= ordinals[r] <= hi]
+
+    # --------------------------- Public Properties ---------------------------
+    def __len__(self):
+        # number of rows in the store
+        return len(self.__ordinals)
+
+    def __contains__(self, animal):
+        # True if the animal has been registered in the store
+        return animal in self.__animal_id_of
+
+    # --------------------------- Writing ---------------------------
+    def register(self, animal):
+        """
+        Give the animal an id in the store and return it, registering the same animal twice returns the same id.
+        """
+        with self.__lock:
+            aid = self.__animal_id_of.get(animal)
+            if aid is None:
+                aid = self.__animal_id_of[animal] = len(self.__animals)
+                self.__animals.append(animal)
+                self.__animal_species.append(self.__intern(animal.species))
+                self.__rows_by_animal.append(array("i"))
+            return aid
+
+    def append(self, animal, record: HealthRecord):
+        """
+        Append a HealthRecord for an animal as one row and return the row number.
+        """
+        with self.__lock:
+            if not isinstance(record, HealthRecord):
+                raise TypeError("Record must be a HealthRecord instance.")
+            aid = self.register(animal)
+            row = len(self.__ordinals)
+            self.__ordinals.append(record.report_on.toordinal())
+            self.__severities.append(record.severity)
+            self.__animal_ids.append(aid)
+            self.__description_ids.append(self.__intern(record.description))
+            self.__notes_ids.append(self.__intern(record.treatment_notes))
+            self.__rows_by_animal[aid].append(row)
+            return row
+
+    # --------------------------- Reading ---------------------------
+    def record_at(self, row):
+        """
+        Materialise a single row back into a HealthRecord object.
+        Rows were checked when the record was first built, so the trusted path skips the checks.
+        """
+        return HealthRecord._restore(self.__strings[self.__description_ids[row]],
+                                     date.fromordinal(self.__ordinals[row]),
+                                     self.__severities[row],
+                                     self.__strings[self.__notes_ids[row]], trusted=True)
+
+    def records_for(self, animal):
+        """
+        Returns a generator over the animal's records in the order they were added.
+        Records are only created as the generator is consumed.
+        """
+        aid = self.__animal_id_of.get(animal)
+        rows = self.__rows_by_animal[aid] if aid is not None else ()
+        return (self.record_at(r) for r in rows)
+
+    def severities_for(self, animal):
+        """
+        Returns a copy of the severity column for the animal's rows without creating any records.
+        """
+        aid = self.__animal_id_of.get(animal)
+        if aid is None:
+            return array("b")
+        return array("b", (self.__severities[r] for r in self.__rows_by_animal[aid]))
+
+    # --------------------------- Aggregations ---------------------------
+    def count(self, since=None, until=None, species=None):
+        """
+        Number of records in the date range (inclusive) and species, None means no filter.
+        """
+        if since is None and until is None and species is None:
+            return len(self.__ordinals)
+        return len(self.__row_filter(since, until, species))
+
+    def severity_by_species(self, since=None, until=None):
+        """
+        Returns {species: {"count": n, "mean": average severity, "max": highest severity}} for the date range.
+        """
+        totals: dict[int, list[int]] = {}
+        severities = self.__severities
+        animal_ids = self.__animal_ids
+        animal_species = self.__animal_species
+        for r in self.__row_filter(since, until, None):
+            sev = severities[r]
+            entry = totals.get(animal_species[animal_ids[r]])
+            if entry is None:
+                totals[animal_species[animal_ids[r]]] = [1, sev, sev]
+            else:
+                entry[0] += 1
+                entry[1] += sev
+                if sev > entry[2]:
+                    entry[2] = sev
+        return {self.__strings[sp]: {"count": n, "mean": total / n, "max": top}
+                for sp, (n, total, top) in totals.items()}
+
+    def severity_histogram(self, since=None, until=None, species=None):
+        """
+        Returns a list of 10 counts, index 0 for severity 1 up to index 9 for severity 10.
+        """
+        histogram = [0] * 10
+        severities = self.__severities
+        for r in self.__row_filter(since, until, species):
+            histogram[severities[r] - 1] += 1
+        return histogram
+
+    def date_histogram(self, since, until, bucket_days=7, species=None):
+        """
+        Returns a list of (bucket start date, count) covering since to until in buckets of bucket_days.
+        """
+        if not isinstance(bucket_days, int) or bucket_days <= 0:
+            raise ValueError("bucket_days must be a positive integer.")
+        if until < since:
+            raise ValueError("until cannot be before since.")
+        start = since.toordinal()
+        buckets = [0] * ((until.toordinal() - start) // bucket_days + 1)
+        ordinals = self.__ordinals
+        for r in self.__row_filter(since, until, species):
+            buckets[(ordinals[r] - start) // bucket_days] += 1
+        return [(date.fromordinal(start + i * bucket_days), n) for i, n in enumerate(buckets)]
+
+    def max_severity_by_animal(self, since=None, until=None):
+        """
+        Returns {animal: highest severity} for every animal with at least one record in the date range (inclusive).
+        With NumPy the ordinal, severity and animal id columns are viewed in place and reduced with maximum.at,
+        otherwise it is one pass over the arrays.
+        """
+        with self.__lock:
+            lo = since.toordinal() if since is not None else float("-inf")
+            hi = until.toordinal() if until is not None else float("inf")
+            top = array("b", bytes(len(self.__animals)))  # 0 means no record in range
+            np = _numpy()
+            if np is not None and len(self.__ordinals):
+                ordinals = np.frombuffer(self.__ordinals, dtype=self.__ordinals.typecode)
+                severities = np.frombuffer(self.__severities, dtype=self.__severities.typecode)
+                animal_ids = np.frombuffer(self.__animal_ids, dtype=self.__animal_ids.typecode)
+                mask = (ordinals >= lo) & (ordinals <= hi)
+                out = np.zeros(len(self.__animals), dtype=severities.dtype)
+                np.maximum.at(out, animal_ids[mask], severities[mask])
+                top = array("b", out.tobytes())
+                # the views hold the column buffers, they must be released before the columns can grow again
+                del ordinals, severities, animal_ids, mask
+            else:
+                ordinals = self.__ordinals
+                severities = self.__severities
+                for r, aid in enumerate(self.__animal_ids):
+                    if lo <= ordinals[r] <= hi and severities[r] > top[aid]:
+                        top[aid] = severities[r]
+            return {self.__animals[aid]: sev for aid, sev in enumerate(top) if sev}
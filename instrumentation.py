@@ -0,0 +1,181 @@
+'''
+File: instrumentation.py
+Description: This instrumentation file counts calls, times them and records why operations were rejected for the
+hot methods of Animal, Enclosure and Staff. It is switched on and off at runtime and costs nothing while off.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing functools.wraps so the patched methods keep their names and docstrings.
+Importing threading to guard the counters when the instrumented objects are used from many threads.
+Importing time.perf_counter to time each call.
+"""
+import threading
+from functools import wraps
+from time import perf_counter
+from animal import Animal
+from enclosure import Enclosure
+from errors import Rejection
+from staff import Staff
+
+# upper bounds in seconds of the latency histogram buckets, the last bucket is +Inf
+LATENCY_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 1e-1)
+
+# (class, method names) that are patched while instrumentation is enabled
+TARGETS = (
+    (Enclosure, ("add_animal", "add_animals", "remove_animal", "clean", "_Enclosure__compatible_with_environment")),
+    (Animal, ("add_health_record", "clear_treatment")),
+    (Staff, ("feed_animal", "clean_enclosure", "perform_health_check", "assign_animal", "assign_enclosure")),
+)
+
+_lock = threading.Lock()
+_originals = {}  # (class, method name) -> the original function, only filled while enabled
+_calls = {}  # label -> [calls, errors, total seconds, [count per bucket, ..., +Inf]]
+_rejections = {}  # label -> {reason: count}
+
+# --------------------------- Private Helpers ---------------------------
+def _label(cls, attr):
+    # "Enclosure.__compatible_with_environment" rather than the mangled attribute name
+    return f"{cls.__name__}.{attr.replace(f'_{cls.__name__}__', '__')}"
+
+def rejection_reason(error):
+    """
+    Returns the rejection reason for an error raised, or a Rejection returned, by an instrumented method
+    e.g. "capacity". The reason is given where the rejection is made (see errors.py), the message is never read.
+    """
+    if isinstance(error, PermissionError):
+        return "permission"
+    return getattr(error, "reason", "invalid")
+
+def _record(label, seconds, reasons=()):
+    """
+    Private helper to count one call with its latency and any rejection reasons.
+    """
+    with _lock:
+        stats = _calls.get(label)
+        if stats is None:
+            stats = _calls[label] = [0, 0, 0.0, [0] * (len(LATENCY_BUCKETS) + 1)]
+        stats[0] += 1
+        stats[2] += seconds
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                break
+        else:
+            i = len(LATENCY_BUCKETS)
+        stats[3][i] += 1
+        if reasons:
+            stats[1] += 1
+            counts = _rejections.setdefault(label, {})
+            for reason in reasons:
+                counts[reason] = counts.get(reason, 0) + 1
+
+def _instrument(label, func):
+    """
+    Private helper returning a wrapper around func that records every call under label.
+    Errors are counted as rejections and raised again, a returned Rejection (e.g. from feed_animal) is counted too
+    and add_animals also counts each rejected animal.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except (ValueError, TypeError, PermissionError) as e:
+            _record(label, perf_counter() - start, (rejection_reason(e),))
+            raise
+        reasons = ()
+        if isinstance(result, Rejection):
+            reasons = (result.reason,)
+        elif isinstance(result, dict) and result.get("rejected"):
+            reasons = [rejection_reason(reason) for _, reason in result["rejected"]]
+        _record(label, perf_counter() - start, reasons)
+        return result
+    return wrapper
+
+# --------------------------- Switching ---------------------------
+def enable():
+    """
+    Patch every method in TARGETS with an instrumented wrapper, does nothing if already enabled.
+    """
+    with _lock:
+        if _originals:
+            return
+        for cls, attrs in TARGETS:
+            for attr in attrs:
+                original = cls.__dict__[attr]
+                _originals[(cls, attr)] = original
+                setattr(cls, attr, _instrument(_label(cls, attr), original))
+
+def disable():
+    """
+    Put the original methods back, so instrumentation has no cost at all while disabled.
+    Counters are kept until reset() is called.
+    """
+    with _lock:
+        for (cls, attr), original in _originals.items():
+            setattr(cls, attr, original)
+        _originals.clear()
+
+def is_enabled():
+    """
+    Returns True while the methods are patched.
+    """
+    return bool(_originals)
+
+def reset():
+    """
+    Clear every counter.
+    """
+    with _lock:
+        _calls.clear()
+        _rejections.clear()
+
+# --------------------------- Output ---------------------------
+def snapshot():
+    """
+    Returns a copy of the counters:
+        {"enabled": bool,
+         "methods": {label: {"calls", "errors", "total_seconds", "buckets": {upper bound: cumulative count}}},
+         "rejections": {label: {reason: count}}}
+    """
+    with _lock:
+        methods = {}
+        for label, (calls, errors, total, counts) in _calls.items():
+            buckets, running = {}, 0
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), counts):
+                running += count
+                buckets[bound] = running
+            methods[label] = {"calls": calls, "errors": errors, "total_seconds": total, "buckets": buckets}
+        rejections = {label: dict(reasons) for label, reasons in _rejections.items()}
+    return {"enabled": is_enabled(), "methods": methods, "rejections": rejections}
+
+def prometheus_text():
+    """
+    Returns the counters in the Prometheus text exposition format.
+    """
+    data = snapshot()
+    lines = ["# HELP zoo_calls_total Calls to an instrumented method.",
+             "# TYPE zoo_calls_total counter"]
+    for label, stats in data["methods"].items():
+        lines.append(f'zoo_calls_total{{method="{label}"}} {stats["calls"]}')
+    lines += ["# HELP zoo_call_errors_total Calls that were rejected.",
+              "# TYPE zoo_call_errors_total counter"]
+    for label, stats in data["methods"].items():
+        lines.append(f'zoo_call_errors_total{{method="{label}"}} {stats["errors"]}')
+    lines += ["# HELP zoo_call_latency_seconds Latency of an instrumented method.",
+              "# TYPE zoo_call_latency_seconds histogram"]
+    for label, stats in data["methods"].items():
+        for bound, count in stats["buckets"].items():
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'zoo_call_latency_seconds_bucket{{method="{label}",le="{le}"}} {count}')
+        lines.append(f'zoo_call_latency_seconds_sum{{method="{label}"}} {stats["total_seconds"]!r}')
+        lines.append(f'zoo_call_latency_seconds_count{{method="{label}"}} {stats["calls"]}')
+    lines += ["# HELP zoo_rejections_total Rejected operations by reason.",
+              "# TYPE zoo_rejections_total counter"]
+    for label, reasons in data["rejections"].items():
+        for reason, count in reasons.items():
+            lines.append(f'zoo_rejections_total{{method="{label}",reason="{reason}"}} {count}')
+    return "\n".join(lines) + "\n"
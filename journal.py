@@ -0,0 +1,203 @@
+'''
+File: journal.py
+Description: This class HealthJournal file appends every health record to an on-disk journal so records survive the
+process exiting. Records are fixed width so appends are cheap and readers can memory map the file and scan it.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing mmap so readers can scan the journal without copying it into memory.
+Importing os and struct to append and pack the fixed width records.
+Importing threading to lock appends, as staff on different threads can share one journal.
+Importing datetime.date to convert between dates and the stored day ordinals.
+"""
+import mmap
+import os
+import struct
+import threading
+from datetime import date
+from animal import HealthRecord
+
+"""
+The journal is two files:
+    <path>       fixed width records, one per health record
+    <path>.heap  UTF-8 text for the animal name, description and treatment notes
+Record layout (little endian, 32 bytes):
+    date ordinal (uint32), severity (uint8), 3 bytes padding,
+    then offset (uint32) and length (uint32) into the heap for the animal name, description and notes
+The heap text is written before its record, so a record is only complete once all of it is on disk.
+"""
+RECORD = struct.Struct("<IB3xIIIIII")
+HEAP_SUFFIX = ".heap"
+
+class HealthJournal:
+    """
+    This class represents an append-only journal of health records.
+    Opening the journal recovers from a crash by dropping any partly written record at the end of the file.
+    """
+    def __init__(self, path):
+        if not isinstance(path, str) or not path.strip():
+            raise ValueError("path cannot be an empty string.")
+        self.__path = path
+        self.__records = open(path, "ab+")
+        self.__heap = open(path + HEAP_SUFFIX, "ab+")
+        self.__lock = threading.Lock()  # one append at a time, the heap offsets depend on it
+        self.__count = self.__recover()
+
+    # --------------------------- Private Helpers ---------------------------
+    def __recover(self):
+        """
+        Private helper to scan the tail of the journal and drop a record that was only partly written.
+        Returns the number of complete records.
+        """
+        records_size = os.fstat(self.__records.fileno()).st_size
+        heap_size = os.fstat(self.__heap.fileno()).st_size
+        count = records_size // RECORD.size
+        # walk back from the end until a record only points at text that made it into the heap
+        while count:
+            self.__records.seek((count - 1) * RECORD.size)
+            fields = RECORD.unpack(self.__records.read(RECORD.size))
+            if fields[-2] + fields[-1] <= heap_size:
+                break
+            count -= 1
+        if count * RECORD.size != records_size:
+            self.__records.truncate(count * RECORD.size)
+        self.__records.seek(0, os.SEEK_END)
+        return count
+
+    def __write_text(self, text):
+        """
+        Private helper to append text to the heap and return its (offset, length).
+        """
+        data = text.encode("utf-8")
+        offset = self.__heap.tell()
+        self.__heap.write(data)
+        return offset, len(data)
+
+    # --------------------------- Public Properties ---------------------------
+    @property
+    def path(self):
+        # path of the record file, the heap is stored next to it
+        return self.__path
+
+    def __len__(self):
+        # number of complete records in the journal
+        return self.__count
+
+    # --------------------------- Writing ---------------------------
+    def append(self, animal_name, record: HealthRecord):
+        """
+        Append a HealthRecord for the named animal.
+        Text is written to the heap first, then the fixed width record that points at it.
+        The whole append is locked so concurrent appends can't interleave their heap text.
+        """
+        if not isinstance(record, HealthRecord):
+            raise TypeError("Record must be a HealthRecord instance.")
+        with self.__lock:
+            self.__heap.seek(0, os.SEEK_END)
+            name = self.__write_text(animal_name)
+            description = self.__write_text(record.description)
+            notes = self.__write_text(record.treatment_notes)
+            self.__heap.flush()
+            self.__records.write(RECORD.pack(record.report_on.toordinal(), record.severity,
+                                             *name, *description, *notes))
+            self.__records.flush()
+            self.__count += 1
+
+    def sync(self):
+        """
+        Force the journal to disk, appends are flushed to the operating system but not synced on every call.
+        """
+        with self.__lock:
+            for f in (self.__heap, self.__records):
+                f.flush()
+                os.fsync(f.fileno())
+
+    def close(self):
+        # closes both files, the journal can't be appended to after this
+        with self.__lock:
+            self.__heap.close()
+            self.__records.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+# --------------------------- Reading ---------------------------
+class JournalReader:
+    """
+    This class represents a read-only, memory mapped view of a journal for analytics processes.
+    Only complete records that point at text already in the heap are visible.
+    Scanning the raw fields does not copy the file, text is only decoded when a record is materialised.
+    """
+    def __init__(self, path):
+        self.__files = []
+        self.__maps = []
+        records = self.__map(path)
+        heap = self.__map(path + HEAP_SUFFIX)
+        count = len(records) // RECORD.size
+        # a writer may be part way through an append, ignore a trailing record whose text is not there yet
+        while count and sum(RECORD.unpack_from(records, (count - 1) * RECORD.size)[-2:]) > len(heap):
+            count -= 1
+        self.__records = memoryview(records)[:count * RECORD.size]
+        self.__heap = heap
+        self.__count = count
+
+    def __map(self, path):
+        """
+        Private helper to memory map a file read-only, an empty file maps to empty bytes.
+        """
+        f = open(path, "rb")
+        self.__files.append(f)
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__maps.append(m)
+        return m
+
+    def __len__(self):
+        return self.__count
+
+    def __text(self, offset, length):
+        # decode a string from the heap
+        return str(self.__heap[offset:offset + length], "utf-8")
+
+    def iter_fields(self):
+        """
+        Generator of the raw (date ordinal, severity, animal offset, animal length, ...) tuples for every record.
+        """
+        return RECORD.iter_unpack(self.__records)
+
+    def severities(self):
+        """
+        Generator of (date ordinal, severity) for every record without decoding any text.
+        """
+        return ((fields[0], fields[1]) for fields in RECORD.iter_unpack(self.__records))
+
+    def records(self):
+        """
+        Generator of (animal name, HealthRecord) for every record, text is decoded as each one is read.
+        """
+        for ordinal, severity, name_off, name_len, desc_off, desc_len, notes_off, notes_len in self.iter_fields():
+            yield (self.__text(name_off, name_len),
+                   HealthRecord._restore(self.__text(desc_off, desc_len), date.fromordinal(ordinal), severity,
+                                         self.__text(notes_off, notes_len), trusted=True))
+
+    def close(self):
+        # release the memory maps and files
+        self.__records.release()
+        for m in self.__maps:
+            m.close()
+        for f in self.__files:
+            f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -11,6 +11,7 @@ This is my own work as defined by the University's Academic Integrity Policy.
 from animal import Mammal, Bird, Reptile, Other
 from enclosure import Enclosure, EnvironmentType
 from staff import Staff
+from zoo import Zoo
 
 def demo():
     """
@@ -19,6 +20,7 @@ def demo():
     2. create enclosures and compatible animals based on EnvironmentType
     3. create staff and assign responsibilities based on role
     4. demonstrate feeding, cleaning, vet checks, error cases (e.g. moving an animal under treatment)
+    5. register everything with a Zoo and use its indexes for lookups
     """
     # create animals using private state, public API used below
     ellie = Mammal(name="Ellie", species="elephant", age=5, diet="Herbivore")
@@ -86,6 +88,24 @@ def demo():
     print(savannah.report_status())
     print()
 
+    # register everything with the zoo so lookups use the indexes instead of scanning every object
+    zoo = Zoo("UniSA Zoo")
+    for animal in (ellie, peta, tilly, fred):
+        zoo.add_animal(animal)
+    zoo.add_enclosure(savannah)
+    zoo.add_enclosure(tropical_dome)
+    zoo.add_staff(zookeeper)
+    zoo.add_staff(vet)
+    zoo.place_animal("Ellie", savannah.name)
+    print(zoo)
+    print(f"Ellie is housed in {zoo.enclosure_of('Ellie').name}")
+    print("Under treatment:", [a.name for a in zoo.animals_under_treatment()])
+    print("Staff covering Ellie:", [s.name for s in zoo.staff_for_animal("Ellie")])
+    for line in zoo.feeding_round("K001", "hay"):  # a feeding round streams one result per animal
+        print(line)
+    zoo.remove_from_enclosure("Ellie")
+    print()
+
     # final printed reports to summarise the zoo state
     print("Final reports:")
     print(ellie)
@@ -0,0 +1,271 @@
+'''
+File: persistence.py
+Description: This persistence file saves and loads a whole Zoo by streaming one row at a time, either as JSON Lines
+or as a compact binary format. Loading uses generators so the file is never held in memory all at once.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing json to write and read each row of a JSON Lines file.
+Importing struct to pack each row of the binary format.
+Importing datetime.date to convert the reported dates of health records.
+"""
+import json
+import struct
+from datetime import date
+from animal import Animal, Mammal, Reptile, Bird, Other, HealthRecord, _as_date
+from enclosure import Enclosure, EnvironmentType
+from staff import Staff
+from zoo import Zoo
+
+# classes an animal row can be restored as, keyed by the class name saved in the "kind" field
+ANIMAL_KINDS = {cls.__name__: cls for cls in (Animal, Mammal, Reptile, Bird, Other)}
+
+"""
+Every row is a dictionary with a "type" field. Rows are written in this order so each can be restored as it is read:
+    zoo, then each animal followed by its health records, then enclosures, then staff
+The field schemas are shared by both formats, the binary format packs the fields in this order with these codes:
+    s = string, q = integer, n = number, ? = boolean, o = date ordinal, L = list of strings
+A number is a tag byte (b"i" integer or b"f" float) followed by 8 bytes, so ints and floats load back unchanged.
+"""
+ROW_SCHEMAS = {
+    "zoo": (("name", "s"),),
+    "animal": (("kind", "s"), ("name", "s"), ("species", "s"), ("age", "q"), ("diet", "s"),
+               ("under_treatment", "?")),
+    "health_record": (("animal", "s"), ("description", "s"), ("reported_on", "o"), ("severity", "q"),
+                      ("treatment_notes", "s")),
+    "enclosure": (("name", "s"), ("size_sqm", "n"), ("environment", "s"), ("capacity", "q"),
+                  ("cleanliness", "n"), ("animals", "L")),
+    "staff": (("staff_id", "s"), ("name", "s"), ("role", "s"), ("animals", "L"), ("enclosures", "L")),
+}
+_ROW_TYPES = tuple(ROW_SCHEMAS)
+_BINARY_MAGIC = b"ZOO1"
+
+# --------------------------- Dumping Rows ---------------------------
+def iter_rows(zoo):
+    """
+    Generator of the rows describing the zoo, in the order they need to be loaded back.
+    """
+    yield {"type": "zoo", "name": zoo.name}
+    for animal in zoo.animals():
+        yield {"type": "animal", "kind": type(animal).__name__, "name": animal.name, "species": animal.species,
+               "age": animal.age, "diet": animal.diet, "under_treatment": animal.under_treatment}
+        for record in animal.get_health_records():
+            yield {"type": "health_record", "animal": animal.name, "description": record.description,
+                   "reported_on": _as_date(record.report_on).isoformat(), "severity": record.severity,
+                   "treatment_notes": record.treatment_notes}
+    for enclosure in zoo.enclosures():
+        yield {"type": "enclosure", "name": enclosure.name, "size_sqm": enclosure.size_sqm,
+               "environment": enclosure.environment.value, "capacity": enclosure.capacity,
+               "cleanliness": enclosure.cleanliness, "animals": enclosure.animal_names()}
+    for staff in zoo.staff():
+        yield {"type": "staff", "staff_id": staff.staff_id, "name": staff.name, "role": staff.role,
+               "animals": staff.assigned_animals, "enclosures": staff.assigned_enclosures}
+
+# --------------------------- Restoring Rows ---------------------------
+def _build_animal(row, records, trusted):
+    """
+    Private helper to restore an animal row together with the health records read after it.
+    """
+    try:
+        cls = ANIMAL_KINDS[row["kind"]]
+    except KeyError:
+        raise ValueError(f"unknown animal kind {row['kind']!r}.") from None
+    return cls._restore(row["name"], row["species"], row["age"], row["diet"], records,
+                        row["under_treatment"], trusted=trusted)
+
+def iter_objects(rows, trusted=False):
+    """
+    Generator that turns rows back into objects, yielding (row type, object) pairs.
+    Only the current animal's health records are held while reading, everything else is yielded as it is read.
+    trusted=True skips every validation check, only use it for files written by save_jsonl or save_binary.
+    """
+    animals = {}
+    pending = None  # (animal row, [HealthRecord, ...]) waiting for the end of its records
+    for row in rows:
+        kind = row.get("type")
+        if kind == "health_record":
+            if pending is None or pending[0]["name"] != row["animal"]:
+                raise ValueError(f"health record for {row['animal']} is not after its animal.")
+            pending[1].append(HealthRecord._restore(row["description"], date.fromisoformat(row["reported_on"]),
+                                                    row["severity"], row["treatment_notes"], trusted=trusted))
+            continue
+        if pending is not None:
+            animal = _build_animal(pending[0], pending[1], trusted)
+            animals[animal.name] = animal
+            pending = None
+            yield "animal", animal
+        if kind == "zoo":
+            yield "zoo", row["name"]
+        elif kind == "animal":
+            pending = (row, [])
+        elif kind == "enclosure":
+            try:
+                occupants = [animals[n] for n in row["animals"]]
+            except KeyError as e:
+                raise ValueError(f"enclosure {row['name']} holds unknown animal {e.args[0]}.") from None
+            yield "enclosure", Enclosure._restore(row["name"], row["size_sqm"],
+                                                  EnvironmentType(row["environment"]), row["capacity"],
+                                                  occupants, row["cleanliness"], trusted=trusted)
+        elif kind == "staff":
+            yield "staff", Staff._restore(row["staff_id"], row["name"], row["role"], row["animals"],
+                                          row["enclosures"], trusted=trusted)
+        else:
+            raise ValueError(f"unknown row type {kind!r}.")
+    if pending is not None:
+        yield "animal", _build_animal(pending[0], pending[1], trusted)
+
+def load_rows(rows, trusted=False):
+    """
+    Builds a Zoo from a stream of rows and returns it.
+    """
+    zoo = None
+    for kind, obj in iter_objects(rows, trusted):
+        if kind == "zoo":
+            zoo = Zoo(obj)
+            continue
+        if zoo is None:
+            raise ValueError("file must start with a zoo row.")
+        if kind == "animal":
+            zoo.add_animal(obj)
+        elif kind == "enclosure":
+            zoo.add_enclosure(obj)
+        else:
+            zoo.add_staff(obj)
+    if zoo is None:
+        raise ValueError("file must start with a zoo row.")
+    return zoo
+
+# --------------------------- JSON Lines ---------------------------
+def _write_jsonl_row(f, row):
+    """
+    Private helper to write one row as a line of a JSON Lines file, shared with AsyncZoo.save_jsonl.
+    """
+    f.write(json.dumps(row, separators=(",", ":")))
+    f.write("\n")
+
+def save_jsonl(zoo, path):
+    """
+    Write the zoo to a JSON Lines file, one row per line.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        for row in iter_rows(zoo):
+            _write_jsonl_row(f, row)
+
+def iter_jsonl(path):
+    """
+    Generator of the rows in a JSON Lines file, reading one line at a time.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def load_jsonl(path, trusted=False):
+    """
+    Load a Zoo saved by save_jsonl.
+    """
+    return load_rows(iter_jsonl(path), trusted)
+
+# --------------------------- Binary ---------------------------
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_BOOL = struct.Struct("<?")
+
+def _pack_str(out, text):
+    data = text.encode("utf-8")
+    out.append(_U32.pack(len(data)))
+    out.append(data)
+
+def _pack_row(row):
+    """
+    Private helper to pack a row as a type byte followed by its fields in schema order.
+    """
+    kind = row["type"]
+    out = [bytes((_ROW_TYPES.index(kind),))]
+    for field, code in ROW_SCHEMAS[kind]:
+        value = row[field]
+        if code == "s":
+            _pack_str(out, value)
+        elif code == "q":
+            out.append(_I64.pack(value))
+        elif code == "n":
+            if isinstance(value, int):
+                out.append(b"i" + _I64.pack(value))
+            else:
+                out.append(b"f" + _F64.pack(value))
+        elif code == "?":
+            out.append(_BOOL.pack(value))
+        elif code == "o":
+            out.append(_U32.pack(date.fromisoformat(value).toordinal()))
+        else:
+            out.append(_U32.pack(len(value)))
+            for text in value:
+                _pack_str(out, text)
+    return b"".join(out)
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("binary file ends part way through a row.")
+    return data
+
+def _read_str(f):
+    return _read_exact(f, _U32.unpack(_read_exact(f, 4))[0]).decode("utf-8")
+
+def _read_number(f):
+    tag = _read_exact(f, 1)
+    if tag == b"i":
+        return _I64.unpack(_read_exact(f, 8))[0]
+    if tag == b"f":
+        return _F64.unpack(_read_exact(f, 8))[0]
+    raise ValueError(f"unknown number tag {tag!r}.")
+
+def save_binary(zoo, path):
+    """
+    Write the zoo to the compact binary format.
+    """
+    with open(path, "wb") as f:
+        f.write(_BINARY_MAGIC)
+        for row in iter_rows(zoo):
+            f.write(_pack_row(row))
+
+def iter_binary(path):
+    """
+    Generator of the rows in a binary file written by save_binary, reading one row at a time.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(_BINARY_MAGIC)) != _BINARY_MAGIC:
+            raise ValueError("file is not a zoo binary file.")
+        while True:
+            tag = f.read(1)
+            if not tag:
+                return
+            if tag[0] >= len(_ROW_TYPES):
+                raise ValueError(f"unknown row type {tag[0]}.")
+            kind = _ROW_TYPES[tag[0]]
+            row = {"type": kind}
+            for field, code in ROW_SCHEMAS[kind]:
+                if code == "s":
+                    row[field] = _read_str(f)
+                elif code == "q":
+                    row[field] = _I64.unpack(_read_exact(f, 8))[0]
+                elif code == "n":
+                    row[field] = _read_number(f)
+                elif code == "?":
+                    row[field] = _BOOL.unpack(_read_exact(f, 1))[0]
+                elif code == "o":
+                    row[field] = date.fromordinal(_U32.unpack(_read_exact(f, 4))[0]).isoformat()
+                else:
+                    row[field] = [_read_str(f) for _ in range(_U32.unpack(_read_exact(f, 4))[0])]
+            yield row
+
+def load_binary(path, trusted=False):
+    """
+    Load a Zoo saved by save_binary.
+    """
+    return load_rows(iter_binary(path), trusted)
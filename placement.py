@@ -0,0 +1,199 @@
+'''
+File: placement.py
+Description: This placement file works out where to put many animals across many enclosures at once, respecting
+capacity, environment compatibility, treatment status and how dirty each enclosure would become.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing heapq to always pick the cleanest enclosure next in greedy mode.
+Importing collections.deque for the breadth first search in exact mode.
+"""
+import heapq
+from collections import deque
+from animal import Animal
+from enclosure import CLEANLINESS_PER_ANIMAL, is_compatible
+
+"""
+Animals of the same species are interchangeable for placement, so both modes work on species groups rather than
+single animals. This keeps the work proportional to species x enclosures instead of animals x enclosures.
+Plans are returned as a dictionary:
+    {"assignments": [(animal, enclosure), ...], "unplaced": [(animal, reason), ...]}
+"""
+PLACEMENT_MODES = ("greedy", "exact")
+
+# --------------------------- Private Helpers ---------------------------
+def _free_slots(enclosure, min_cleanliness):
+    """
+    Private helper for how many more animals an enclosure can take before it is full or
+    drops below min_cleanliness.
+    At the default min_cleanliness of 0 only capacity counts, as add_animal never refuses a dirty enclosure.
+    """
+    by_capacity = enclosure.capacity - enclosure.occupancy
+    if min_cleanliness <= 0:
+        return max(0, by_capacity)
+    by_cleanliness = int((enclosure.cleanliness - min_cleanliness) // CLEANLINESS_PER_ANIMAL)
+    return max(0, min(by_capacity, by_cleanliness))
+
+def _group_by_species(animals, enclosures, unplaced):
+    """
+    Private helper to group the placeable animals by species, animals that can't be placed go to unplaced.
+    Names must be unique across the batch and the given enclosures, as add_animals rejects a whole batch
+    on one clash:
+        - an animal already housed in one of the enclosures is not planned again
+        - a name already used by another animal in one of the enclosures is rejected
+        - a name repeated in the batch is only planned the first time
+    """
+    housed = {}  # animal name -> (animal, enclosure) for every animal already in the enclosures
+    for enclosure in enclosures:
+        for occupant in enclosure.occupants():
+            housed[occupant.name] = (occupant, enclosure)
+    seen = set()
+    groups = {}
+    for animal in animals:
+        if not isinstance(animal, Animal):
+            unplaced.append((animal, "animal must be a valid Animal instance."))
+        elif animal.under_treatment:
+            unplaced.append((animal, "animal undergoing treatment cannot be placed into an enclosure."))
+        elif animal.name in housed:
+            occupant, enclosure = housed[animal.name]
+            if occupant is animal:
+                unplaced.append((animal, f"{animal.name} is already housed in enclosure {enclosure.name}."))
+            else:
+                unplaced.append((animal, f"Animal named {animal.name} is already in enclosure {enclosure.name}."))
+        elif animal.name in seen:
+            unplaced.append((animal, f"Animal named {animal.name} appears more than once in the batch."))
+        else:
+            seen.add(animal.name)
+            groups.setdefault(animal.species, []).append(animal)
+    return groups
+
+def _greedy(groups, enclosures, slots):
+    """
+    Private helper that places the most constrained species first, each animal into the compatible enclosure
+    that is cleanest after the animals already planned for it.
+    Returns {species: [(enclosure index, count), ...]}.
+    """
+    compatible = {sp: [i for i, e in enumerate(enclosures) if is_compatible(e.environment, sp)] for sp in groups}
+    planned_dirt = [0.0] * len(enclosures)
+    result = {}
+    for sp in sorted(groups, key=lambda s: len(compatible[s])):
+        heap = [(-(enclosures[i].cleanliness - planned_dirt[i]), i) for i in compatible[sp] if slots[i]]
+        heapq.heapify(heap)
+        counts = {}
+        for _ in groups[sp]:
+            if not heap:
+                break
+            _, i = heapq.heappop(heap)
+            counts[i] = counts.get(i, 0) + 1
+            slots[i] -= 1
+            planned_dirt[i] += CLEANLINESS_PER_ANIMAL
+            if slots[i]:
+                heapq.heappush(heap, (-(enclosures[i].cleanliness - planned_dirt[i]), i))
+        result[sp] = list(counts.items())
+    return result
+
+def _exact(groups, enclosures, slots):
+    """
+    Private helper that places the largest possible number of animals using a maximum flow:
+        source -> species (number of animals) -> compatible enclosure -> sink (free slots)
+    Solved with Dinic's algorithm. Returns {species: [(enclosure index, count), ...]}.
+    """
+    species = list(groups)
+    n_species = len(species)
+    source = n_species + len(enclosures)
+    sink = source + 1
+    graph = [[] for _ in range(sink + 1)]  # edges as [to, remaining capacity, index of reverse edge]
+
+    def add_edge(u, v, cap):
+        graph[u].append([v, cap, len(graph[v])])
+        graph[v].append([u, 0, len(graph[u]) - 1])
+
+    for s, sp in enumerate(species):
+        add_edge(source, s, len(groups[sp]))
+        for i, e in enumerate(enclosures):
+            if slots[i] and is_compatible(e.environment, sp):
+                add_edge(s, n_species + i, len(groups[sp]))
+    for i in range(len(enclosures)):
+        if slots[i]:
+            add_edge(n_species + i, sink, slots[i])
+
+    while True:
+        level = [-1] * len(graph)
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for v, cap, _ in graph[u]:
+                if cap and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        if level[sink] < 0:
+            break
+        progress = [0] * len(graph)
+
+        def push(u, limit):
+            if u == sink:
+                return limit
+            edges = graph[u]
+            while progress[u] < len(edges):
+                edge = edges[progress[u]]
+                v, cap, rev = edge
+                if cap and level[v] == level[u] + 1:
+                    sent = push(v, min(limit, cap))
+                    if sent:
+                        edge[1] -= sent
+                        graph[v][rev][1] += sent
+                        return sent
+                progress[u] += 1
+            return 0
+
+        while push(source, float("inf")):
+            pass
+
+    result = {}
+    for s, sp in enumerate(species):
+        # flow on a species -> enclosure edge is the capacity used up on it
+        result[sp] = [(v - n_species, len(groups[sp]) - cap) for v, cap, _ in graph[s]
+                      if v != source and cap < len(groups[sp])]
+    return result
+
+# --------------------------- Public API ---------------------------
+def plan_placements(animals, enclosures, mode="greedy", min_cleanliness=0):
+    """
+    Works out a feasible assignment of animals to enclosures without changing anything.
+    mode="greedy" is fast and places animals into the cleanest compatible enclosure.
+    mode="exact" places the largest possible number of animals.
+    Enclosures are never planned past their capacity or below min_cleanliness.
+    """
+    if mode not in PLACEMENT_MODES:
+        raise ValueError(f"mode must be one of {PLACEMENT_MODES}.")
+    if not isinstance(min_cleanliness, (int, float)) or not (0 <= min_cleanliness <= 100):
+        raise ValueError("min_cleanliness must be a number between 0 and 100.")
+    enclosures = list(enclosures)
+    unplaced = []
+    groups = _group_by_species(animals, enclosures, unplaced)
+    slots = [_free_slots(e, min_cleanliness) for e in enclosures]
+    counts = (_greedy if mode == "greedy" else _exact)(groups, enclosures, slots)
+
+    assignments = []
+    for sp, members in groups.items():
+        placed = 0
+        for i, n in counts.get(sp, ()):
+            assignments.extend((animal, enclosures[i]) for animal in members[placed:placed + n])
+            placed += n
+        unplaced.extend((animal, "no compatible enclosure with free space.") for animal in members[placed:])
+    return {"assignments": assignments, "unplaced": unplaced}
+
+def apply_plan(plan):
+    """
+    Carries out a plan with one Enclosure.add_animals batch per enclosure.
+    Returns {enclosure name: add_animals report}.
+    """
+    batches = {}
+    for animal, enclosure in plan["assignments"]:
+        batches.setdefault(enclosure, []).append(animal)
+    return {enclosure.name: enclosure.add_animals(batch) for enclosure, batch in batches.items()}
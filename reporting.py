@@ -0,0 +1,87 @@
+'''
+File: reporting.py
+Description: This reporting file renders the full zoo report in parallel. A compact snapshot of plain tuples is
+taken from the live objects, split into chunks, rendered in worker processes and joined back in a stable order.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+concurrent.futures.ProcessPoolExecutor renders the chunks on several cores, it is only imported when a pool is
+needed as it is slow to import. Only tuples of strings, numbers and booleans are sent to the workers.
+"""
+from animal import format_animal_summary
+from enclosure import format_enclosure_status, format_occupant
+from staff import format_staff_summary
+
+"""
+Snapshot layout, one tuple per section entry:
+    enclosure: ("enclosure", name, capacity, environment value, cleanliness, (animal, ...))
+    unplaced:  ("unplaced", (animal, ...))
+    staff:     ("staff", name, role, (animal name, ...), (enclosure name, ...))
+    animal:    (name, species, age, diet, under_treatment)
+"""
+
+# --------------------------- Snapshot ---------------------------
+def _animal_row(animal):
+    # plain values of an animal needed to render it
+    return animal.name, animal.species, animal.age, animal.diet, animal.under_treatment
+
+def snapshot(zoo):
+    """
+    Returns a list of plain tuples describing every enclosure, unplaced animal and staff member of the zoo.
+    """
+    rows = []
+    for enclosure in zoo.enclosures():
+        rows.append(("enclosure", enclosure.name, enclosure.capacity, enclosure.environment.value,
+                     enclosure.cleanliness, tuple(_animal_row(a) for a in zoo.animals_in(enclosure.name))))
+    unplaced = tuple(_animal_row(a) for a in zoo.animals() if zoo.enclosure_of(a.name) is None)
+    if unplaced:
+        rows.append(("unplaced", unplaced))
+    for staff in zoo.staff():
+        rows.append(("staff", staff.name, staff.role, tuple(staff.assigned_animals),
+                     tuple(staff.assigned_enclosures)))
+    return rows
+
+# --------------------------- Rendering ---------------------------
+def render_row(row):
+    """
+    Renders one snapshot row with the same formatting as report_status, list_animals and __str__.
+    """
+    if row[0] == "enclosure":
+        _, name, capacity, environment, cleanliness, animals = row
+        lines = [format_enclosure_status(name, len(animals), capacity, environment, cleanliness)]
+        lines.extend(format_occupant(a[0], a[1]) for a in animals)
+        lines.extend(format_animal_summary(*a) for a in animals)
+        return "\n".join(lines)
+    if row[0] == "unplaced":
+        return "\n".join(["Animals not in an enclosure:"] + [format_animal_summary(*a) for a in row[1]])
+    _, name, role, animals, enclosures = row
+    return format_staff_summary(name, role, animals, enclosures)
+
+def render_chunk(rows):
+    """
+    Renders a chunk of snapshot rows, run inside a worker process.
+    """
+    return [render_row(row) for row in rows]
+
+def generate_report(zoo, workers=None, chunk_size=256):
+    """
+    Returns the full zoo report as one string, sections in the same order as the zoo registry.
+    workers is the number of processes (None uses every core), 1 renders in this process without a pool.
+    """
+    if workers is not None and (not isinstance(workers, int) or workers <= 0):
+        raise ValueError("workers must be a positive integer.")
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    rows = snapshot(zoo)
+    chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        rendered = map(render_chunk, chunks)
+        return "\n".join(section for chunk in rendered for section in chunk)
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map returns the results in the order of the chunks, so the report order is stable
+        return "\n".join(section for chunk in pool.map(render_chunk, chunks) for section in chunk)
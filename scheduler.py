@@ -0,0 +1,193 @@
+'''
+File: scheduler.py
+Description: This class TaskScheduler file queues feeding, cleaning and health check tasks and routes each one up
+front to a staff member with the right role, spreading the work across staff by how many tasks they already have.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing heapq to find the staff member with the lowest workload for a role.
+Importing collections.deque for the first in, first out queues of pending tasks.
+Importing time.perf_counter to measure queue latency and throughput.
+"""
+import heapq
+from collections import deque
+from time import perf_counter
+from animal import Animal
+from enclosure import Enclosure
+
+# the role that is allowed to carry out each kind of task
+TASK_ROLES = {"feed": "Zookeeper", "clean": "Zookeeper", "health_check": "Veterinarian"}
+
+class Task:
+    """
+    This class represents one pending task.
+    target is an Animal for feed and health_check tasks and an Enclosure for clean tasks.
+    args are passed on to the staff action e.g. the food, or the description, severity and treatment notes.
+    """
+    __slots__ = ("kind", "target", "args", "seq", "submitted_at")
+
+    def __init__(self, kind, target, args, seq, submitted_at):
+        self.kind = kind
+        self.target = target
+        self.args = args
+        self.seq = seq
+        self.submitted_at = submitted_at
+
+class TaskScheduler:
+    """
+    This class represents a scheduler that holds a queue of pending tasks for each kind of task.
+    Routing is decided before a task is run:
+        - only staff with the role in TASK_ROLES are eligible
+        - if an AssignmentIndex is given, staff assigned to the animal or enclosure are preferred
+        - otherwise the eligible staff member with the lowest workload is chosen from a heap
+    Workload is the number of tasks a staff member has been given by this scheduler.
+    """
+    def __init__(self, staff, index=None, clock=perf_counter):
+        self.__index = index
+        self.__clock = clock
+        self.__queues = {kind: deque() for kind in TASK_ROLES}
+        self.__workload = {}
+        self.__heaps = {role: [] for role in set(TASK_ROLES.values())}
+        self.__seq = 0
+        self.__completed = 0
+        self.__failed = 0
+        self.__latency_total = 0.0
+        self.__latency_max = 0.0
+        self.__busy = 0.0  # seconds spent running tasks
+        for member in staff:
+            self.add_staff(member)
+
+    # --------------------------- Private Helpers ---------------------------
+    def __push(self, member):
+        """
+        Private helper to push a newly added staff member onto their role's heap with their current workload.
+        Every staff member has exactly one entry, it is brought up to date by __least_loaded when the heap is used.
+        """
+        self.__seq += 1
+        heapq.heappush(self.__heaps[member.role], (self.__workload[member], self.__seq, member))
+
+    def __least_loaded(self, role):
+        """
+        Private helper returning the staff member with the lowest workload for a role, or None.
+        Workloads only go up, so an out of date entry is a lower bound: it is replaced with the current workload
+        until the top entry is up to date, which is then the true minimum.
+        """
+        heap = self.__heaps[role]
+        while heap:
+            workload, _, member = heap[0]
+            current = self.__workload[member]
+            if current == workload:
+                return member
+            self.__seq += 1
+            heapq.heapreplace(heap, (current, self.__seq, member))  # out of date entry
+        return None
+
+    def __route(self, task):
+        """
+        Private helper to pick the staff member for a task, or None if nobody is eligible.
+        """
+        role = TASK_ROLES[task.kind]
+        if self.__index is not None:
+            if task.kind == "clean":
+                assigned = self.__index.staff_for_enclosure(task.target.name)
+            else:
+                assigned = self.__index.staff_for_animal(task.target.name)
+            assigned = [s for s in assigned if s.role == role and s in self.__workload]
+            if assigned:
+                return min(assigned, key=self.__workload.__getitem__)
+        return self.__least_loaded(role)
+
+    def __next_task(self):
+        """
+        Private helper to take the oldest task across every queue.
+        """
+        oldest = None
+        for queue in self.__queues.values():
+            if queue and (oldest is None or queue[0].seq < oldest[0].seq):
+                oldest = queue
+        return oldest.popleft() if oldest is not None else None
+
+    def __execute(self, member, task):
+        """
+        Private helper to run a task with the staff member's role specific action.
+        """
+        if task.kind == "feed":
+            return member.feed_animal(task.target, *task.args)
+        if task.kind == "clean":
+            return member.clean_enclosure(task.target)
+        return member.perform_health_check(task.target, *task.args)
+
+    # --------------------------- Public API ---------------------------
+    def add_staff(self, member):
+        """
+        Register a staff member so tasks can be routed to them.
+        """
+        if member in self.__workload:
+            return
+        self.__workload[member] = 0
+        self.__push(member)
+
+    def submit(self, kind, target, *args):
+        """
+        Queue a task, kind must be one of TASK_ROLES.
+        """
+        if kind not in TASK_ROLES:
+            raise ValueError(f"kind must be one of {tuple(TASK_ROLES)}.")
+        expected = Enclosure if kind == "clean" else Animal
+        if not isinstance(target, expected):
+            raise TypeError(f"target of a {kind} task must be an {expected.__name__} instance.")
+        self.__seq += 1
+        self.__queues[kind].append(Task(kind, target, args, self.__seq, self.__clock()))
+
+    def pending(self):
+        """
+        Returns the number of tasks waiting in the queues.
+        """
+        return sum(len(q) for q in self.__queues.values())
+
+    def run(self, limit=None):
+        """
+        Route and run up to limit pending tasks (all of them if None), oldest first.
+        Returns a list of (task, staff member or None, result or error message, succeeded).
+        """
+        results = []
+        while limit is None or len(results) < limit:
+            task = self.__next_task()
+            if task is None:
+                break
+            started = self.__clock()
+            latency = started - task.submitted_at
+            self.__latency_total += latency
+            self.__latency_max = max(self.__latency_max, latency)
+            member = self.__route(task)
+            if member is None:
+                self.__failed += 1
+                results.append((task, None, f"no {TASK_ROLES[task.kind]} is available for a {task.kind} task.",
+                                False))
+                continue
+            self.__workload[member] += 1
+            try:
+                results.append((task, member, self.__execute(member, task), True))
+                self.__completed += 1
+            except (ValueError, TypeError, PermissionError) as e:
+                results.append((task, member, str(e), False))
+                self.__failed += 1
+            self.__busy += self.__clock() - started
+        return results
+
+    def metrics(self):
+        """
+        Returns the throughput (tasks per second of running time), queue latency in seconds and workload by staff.
+        """
+        handled = self.__completed + self.__failed
+        return {"completed": self.__completed,
+                "failed": self.__failed,
+                "pending": self.pending(),
+                "throughput_per_sec": handled / self.__busy if self.__busy else 0.0,
+                "mean_latency": self.__latency_total / handled if handled else 0.0,
+                "max_latency": self.__latency_max,
+                "workload": {member.name: n for member, n in self.__workload.items()}}
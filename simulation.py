@@ -0,0 +1,190 @@
+'''
+File: simulation.py
+Description: This class CleanlinessSimulation file advances a clock over the enclosures, letting cleanliness decay
+with occupancy and size, and sends zookeepers to clean an enclosure once it gets too dirty.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing heapq as the priority queue of scheduled events, ordered by time.
+NumPy is optional, when it is installed all enclosures are stepped together as arrays.
+It is only imported when the first simulation is created as importing it is slow.
+"""
+import heapq
+
+_np = False  # False until NumPy has been looked up, then the module or None
+
+def _numpy():
+    """
+    Returns the numpy module, or None if it is not installed, importing it on the first call.
+    """
+    global _np
+    if _np is False:
+        try:
+            import numpy
+        except ImportError:  # fall back to plain lists and arrays
+            numpy = None
+        _np = numpy
+    return _np
+
+# event kinds, a step decays every enclosure and a clean restores one enclosure
+STEP = "step"
+CLEAN = "clean"
+
+class CleanlinessSimulation:
+    """
+    This class represents a discrete event simulation of enclosure cleanliness.
+    Time is measured in hours from the start of the simulation.
+    Each enclosure loses decay_rate points per hour for every animal per 100 square metres.
+    When an enclosure drops below clean_threshold a clean is scheduled response_hours later, carried out by a
+    zookeeper assigned to the enclosure (or any zookeeper if none are assigned), taking turns between them.
+    Cleanliness is kept in arrays while running and written back to the Enclosure objects by sync().
+    Occupancy is read when the simulation is created, call refresh() after adding or removing animals.
+    """
+    def __init__(self, enclosures, staff, decay_rate=0.5, clean_threshold=40.0, response_hours=2.0,
+                 step_hours=24.0):
+        for value, label in ((decay_rate, "decay_rate"), (clean_threshold, "clean_threshold"),
+                             (response_hours, "response_hours")):
+            if not isinstance(value, (int, float)) or value < 0:
+                raise ValueError(f"{label} must be a non-negative number.")
+        if not isinstance(step_hours, (int, float)) or step_hours <= 0:
+            raise ValueError("step_hours must be a positive number.")
+        self.__enclosures = list(enclosures)
+        self.__decay_rate = decay_rate
+        self.__threshold = clean_threshold
+        self.__response = response_hours
+        self.__step = step_hours
+        self.__clock = 0.0
+        self.__last_step = 0.0
+        self.__events = []
+        self.__seq = 0  # tie breaker so events at the same time run in the order they were scheduled
+        self.__pending = [False] * len(self.__enclosures)
+        self.__cleanings = 0
+        self.__cleanings_by_staff = {}
+        self.__lowest = 100.0
+
+        zookeepers = [s for s in staff if s.role == "Zookeeper"]
+        self.__cleaners = []
+        for e in self.__enclosures:
+            assigned = [s for s in zookeepers if s.is_assigned_enclosure(e.name)]
+            self.__cleaners.append(assigned or zookeepers)
+        self.__turn = [0] * len(self.__enclosures)
+        self.refresh()
+
+    # --------------------------- Private Helpers ---------------------------
+    def __schedule(self, time, kind, index=None):
+        """
+        Private helper to push an event onto the priority queue.
+        """
+        heapq.heappush(self.__events, (time, self.__seq, kind, index))
+        self.__seq += 1
+
+    def __decay(self, hours):
+        """
+        Private helper to decay every enclosure by hours, all at once.
+        Returns the indexes of enclosures that dropped below the threshold and have no clean scheduled.
+        """
+        threshold = self.__threshold
+        pending = self.__pending
+        np = _numpy()
+        if np is not None:
+            c = self.__cleanliness
+            np.maximum(c - self.__rates * hours, 0.0, out=c)
+            self.__lowest = min(self.__lowest, float(c.min(initial=100.0)))
+            return np.nonzero((c < threshold) & ~pending)[0].tolist()
+        c = self.__cleanliness = [max(0.0, v - r * hours) for v, r in zip(self.__cleanliness, self.__rates)]
+        if c:
+            self.__lowest = min(self.__lowest, min(c))
+        return [i for i, v in enumerate(c) if v < threshold and not pending[i]]
+
+    def __clean(self, index):
+        """
+        Private helper to carry out a scheduled clean with the next zookeeper in turn.
+        The cleaned value is credited with the decay already counted since the last step,
+        so the next step leaves it at the correct value.
+        """
+        self.__pending[index] = False
+        cleaners = self.__cleaners[index]
+        if not cleaners:
+            return
+        staff = cleaners[self.__turn[index] % len(cleaners)]
+        self.__turn[index] += 1
+        staff.clean_enclosure(self.__enclosures[index])
+        self.__cleanliness[index] = 100.0 + self.__rates[index] * (self.__clock - self.__last_step)
+        self.__cleanings += 1
+        self.__cleanings_by_staff[staff.name] = self.__cleanings_by_staff.get(staff.name, 0) + 1
+
+    # --------------------------- Public Properties ---------------------------
+    @property
+    def clock(self):
+        # hours simulated so far
+        return self.__clock
+
+    # --------------------------- Running ---------------------------
+    def refresh(self):
+        """
+        Reads the occupancy, size and cleanliness of every enclosure again, e.g. after animals have moved.
+        """
+        rates = [self.__decay_rate * e.occupancy * 100.0 / e.size_sqm for e in self.__enclosures]
+        cleanliness = [float(e.cleanliness) for e in self.__enclosures]
+        np = _numpy()
+        if np is not None:
+            self.__rates = np.array(rates, dtype=float)
+            self.__cleanliness = np.array(cleanliness, dtype=float)
+            self.__pending = np.array(self.__pending, dtype=bool)
+        else:
+            self.__rates = rates
+            self.__cleanliness = cleanliness
+
+    def run(self, hours):
+        """
+        Advance the clock by hours, processing steps and cleans in time order, then sync the enclosures.
+        Returns a summary dictionary of the simulation so far.
+        """
+        if not isinstance(hours, (int, float)) or hours <= 0:
+            raise ValueError("hours must be a positive number.")
+        end = self.__clock + hours
+        t = self.__last_step + self.__step
+        while t < end:
+            self.__schedule(t, STEP)
+            t += self.__step
+        self.__schedule(end, STEP)
+
+        while self.__events and self.__events[0][0] <= end:
+            time, _, kind, index = heapq.heappop(self.__events)
+            self.__clock = time
+            if kind == CLEAN:
+                self.__clean(index)
+                continue
+            for i in self.__decay(time - self.__last_step):
+                self.__pending[i] = True
+                self.__schedule(time + self.__response, CLEAN, i)
+            self.__last_step = time
+        self.__clock = end
+        self.sync()
+        return self.summary()
+
+    def run_days(self, days):
+        """
+        Advance the clock by a number of days.
+        """
+        return self.run(days * 24.0)
+
+    def sync(self):
+        """
+        Write the simulated cleanliness back to the Enclosure objects.
+        """
+        for enclosure, value in zip(self.__enclosures, self.__cleanliness):
+            drop = enclosure.cleanliness - min(100.0, float(value))
+            if drop > 0:
+                enclosure.decay_cleanliness(drop)
+
+    def summary(self):
+        """
+        Returns the hours simulated, number of cleans (in total and by staff name) and the lowest cleanliness seen.
+        """
+        return {"hours": self.__clock, "cleanings": self.__cleanings,
+                "cleanings_by_staff": dict(self.__cleanings_by_staff), "lowest_cleanliness": self.__lowest}
@@ -8,9 +8,84 @@ Username: chuey008
 This is my own work as defined by the University's Academic Integrity Policy.
 '''
 
-from typing import List
+import threading
 from datetime import date
-from animal import Animal, HealthRecord
+from animal import Animal, HealthRecord, _raise_row_errors, _row_errors
+from errors import MissingError, Rejection, TreatmentError
+from events import bus, AnimalAssigned, AnimalUnassigned, EnclosureAssigned, EnclosureUnassigned
+
+def format_staff_summary(name, role, animals, enclosures):
+    """
+    Formats the summary used by Staff.__str__ from plain values, so reports can be rendered from a snapshot.
+    """
+    return f"{name} ({role}) - Animals: {list(animals)} | Enclosures: {list(enclosures)}"
+
+class AssignmentIndex:
+    """
+    This class represents a reverse index shared by many staff members, from animal or enclosure name to the
+    staff responsible for it.
+    Staff members attached to the index keep it up to date on every assign and unassign.
+    Dictionaries are used as insertion ordered sets.
+    """
+    def __init__(self):
+        self.__by_animal: dict[str, dict["Staff", None]] = {}
+        self.__by_enclosure: dict[str, dict["Staff", None]] = {}
+        self.__lock = threading.Lock()  # shared by every staff member attached to the index
+
+    # --------------------------- Private Helpers ---------------------------
+    def __discard(self, index, key, staff):
+        """
+        Private helper to remove a staff member from an index entry, dropping the entry once it is empty.
+        """
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(staff, None)
+            if not bucket:
+                del index[key]
+
+    # --------------------------- Updates from Staff ---------------------------
+    def add_animal(self, staff, animal_name):
+        """
+        Record that the staff member is assigned to the animal.
+        """
+        with self.__lock:
+            self.__by_animal.setdefault(animal_name, {})[staff] = None
+
+    def remove_animal(self, staff, animal_name):
+        """
+        Record that the staff member is no longer assigned to the animal.
+        """
+        with self.__lock:
+            self.__discard(self.__by_animal, animal_name, staff)
+
+    def add_enclosure(self, staff, enclosure_name):
+        """
+        Record that the staff member is assigned to the enclosure.
+        """
+        with self.__lock:
+            self.__by_enclosure.setdefault(enclosure_name, {})[staff] = None
+
+    def remove_enclosure(self, staff, enclosure_name):
+        """
+        Record that the staff member is no longer assigned to the enclosure.
+        """
+        with self.__lock:
+            self.__discard(self.__by_enclosure, enclosure_name, staff)
+
+    # --------------------------- Lookups ---------------------------
+    def staff_for_animal(self, animal_name):
+        """
+        Returns the staff members assigned to the animal, in the order they were assigned.
+        """
+        with self.__lock:
+            return list(self.__by_animal.get(animal_name, ()))
+
+    def staff_for_enclosure(self, enclosure_name):
+        """
+        Returns the staff members assigned to the enclosure, in the order they were assigned.
+        """
+        with self.__lock:
+            return list(self.__by_enclosure.get(enclosure_name, ()))
 
 class Staff:
     def __init__(self, staff_id, name, role):
@@ -25,10 +100,15 @@ class Staff:
         self.__staff_id = staff_id
         self.__name = name
         self.__role = role
-        self.__assigned_animals = []
-        self.__assigned_enclosures = []
+        # dictionaries used as insertion ordered sets of names
+        self.__assigned_animals: dict[str, None] = {}
+        self.__assigned_enclosures: dict[str, None] = {}
+        self.__index = None  # optional shared AssignmentIndex for reverse lookups
+        self.__lock = threading.RLock()  # guards the assignments between threads
+        self.__journal = None  # optional HealthJournal that keeps every health record this staff member creates
 
-    def __validate_init(self, staff_id, name, role):
+    @staticmethod
+    def __validate_init(staff_id, name, role):
         """
         Internal validator to help conduct checks for testing.
         """
@@ -41,18 +121,33 @@ class Staff:
 
     # --------------------------- Public Properties ---------------------------
     # using @property decorator to transform a method into a getter
+    @property
     def staff_id(self):
         # public staff identifier
         return self.__staff_id
 
+    @property
     def name(self):
         # public name identifier
         return self.__name
 
+    @property
     def role(self):
         # public role identifier
         return self.__role
 
+    @property
+    def assigned_animals(self):
+        # copy of the names of animals assigned to this staff member
+        with self.__lock:
+            return list(self.__assigned_animals)
+
+    @property
+    def assigned_enclosures(self):
+        # copy of the names of enclosures assigned to this staff member
+        with self.__lock:
+            return list(self.__assigned_enclosures)
+
     # --------------------------- Assignment Helpers ---------------------------
     def assign_animal(self, animal):
         """
@@ -60,20 +155,102 @@ class Staff:
         Method stores the animal's name only, this is to avoid duplicating object references.
         Checks to see if what is chosen is an actual animal.
         """
-        if not isinstance(animal, Animal):
-            raise TypeError("animal must be an Animal instance.")
-        if animal.name not in self.__assigned_animals:
-            self.__assigned_animals.append(animal.name)
+        with self.__lock:
+            if not isinstance(animal, Animal):
+                raise TypeError("animal must be an Animal instance.")
+            if animal.name not in self.__assigned_animals:
+                self.__assigned_animals[animal.name] = None
+                if self.__index is not None:
+                    self.__index.add_animal(self, animal.name)
+                if bus.active:
+                    bus.emit(AnimalAssigned(self, animal.name))
 
     def assign_enclosure(self, enclosure_name):
         """
         This will assign an enclosure to the staff member.
         Checks to see if what is chosen is an actual enclosure, needs to be a string and not empty.
         """
-        if not isinstance(enclosure_name, str) or not enclosure_name.strip():
-            raise ValueError("enclosure_name cannot be an empty string.")
-        if enclosure_name not in self.__assigned_enclosures:
-            self.__assigned_enclosures.append(enclosure_name.strip())
+        with self.__lock:
+            if not isinstance(enclosure_name, str) or not enclosure_name.strip():
+                raise ValueError("enclosure_name cannot be an empty string.")
+            enclosure_name = enclosure_name.strip()
+            if enclosure_name not in self.__assigned_enclosures:
+                self.__assigned_enclosures[enclosure_name] = None
+                if self.__index is not None:
+                    self.__index.add_enclosure(self, enclosure_name)
+                if bus.active:
+                    bus.emit(EnclosureAssigned(self, enclosure_name))
+
+    def unassign_animal(self, animal_name):
+        """
+        This will remove an animal from the staff member by name.
+        If the animal is not assigned it raises a ValueError.
+        """
+        with self.__lock:
+            try:
+                del self.__assigned_animals[animal_name]
+            except KeyError:
+                raise MissingError(f"Animal named {animal_name} is not assigned to {self.__name}.") from None
+            if self.__index is not None:
+                self.__index.remove_animal(self, animal_name)
+            if bus.active:
+                bus.emit(AnimalUnassigned(self, animal_name))
+
+    def unassign_enclosure(self, enclosure_name):
+        """
+        This will remove an enclosure from the staff member by name.
+        If the enclosure is not assigned it raises a ValueError.
+        """
+        with self.__lock:
+            try:
+                del self.__assigned_enclosures[enclosure_name]
+            except KeyError:
+                raise MissingError(f"Enclosure named {enclosure_name} is not assigned to {self.__name}.") from None
+            if self.__index is not None:
+                self.__index.remove_enclosure(self, enclosure_name)
+            if bus.active:
+                bus.emit(EnclosureUnassigned(self, enclosure_name))
+
+    def is_assigned_animal(self, animal_name):
+        """
+        Returns True if the animal is assigned to the staff member.
+        """
+        return animal_name in self.__assigned_animals
+
+    def is_assigned_enclosure(self, enclosure_name):
+        """
+        Returns True if the enclosure is assigned to the staff member.
+        """
+        return enclosure_name in self.__assigned_enclosures
+
+    def attach_index(self, index):
+        """
+        Attach a shared AssignmentIndex, existing assignments are added to it straight away.
+        A staff member can only be attached to one index at a time, passing None detaches it.
+        """
+        with self.__lock:
+            if index is self.__index:
+                return
+            if index is not None and self.__index is not None:
+                raise ValueError(f"{self.__name} is already attached to an assignment index.")
+            old, self.__index = self.__index, index
+            for animal_name in self.__assigned_animals:
+                if old is not None:
+                    old.remove_animal(self, animal_name)
+                if index is not None:
+                    index.add_animal(self, animal_name)
+            for enclosure_name in self.__assigned_enclosures:
+                if old is not None:
+                    old.remove_enclosure(self, enclosure_name)
+                if index is not None:
+                    index.add_enclosure(self, enclosure_name)
+
+    def attach_journal(self, journal):
+        """
+        Attach a HealthJournal so every health check this staff member performs is also appended to disk.
+        Passing None detaches the journal.
+        """
+        self.__journal = journal
 
     # --------------------------- Role Specific Actions ---------------------------
     def feed_animal(self, animal: Animal, food):
@@ -88,9 +265,46 @@ class Staff:
         if not isinstance(animal, Animal):
             raise TypeError("animal must be an Animal instance.")
         if animal.under_treatment:
-            return f"{animal.name} is undergoing treatment, and should not be fed without vet approval."
+            return Rejection(f"{animal.name} is undergoing treatment, and should not be fed without vet approval.",
+                             TreatmentError.reason)
         return animal.eat(food)
 
+    def feeding_round(self, feed_plan, animal_index):
+        """
+        Feeding all the animals in a round is done by the zookeepers, the role is checked once up front.
+        feed_plan is either a single food for every assigned animal, or a mapping of animal name to food.
+        animal_index is a mapping of animal name to Animal object, e.g. the Zoo registry, used to resolve names.
+        Returns a generator that feeds one animal per result so large rounds stream out instead of building a list.
+        Animals that are not assigned, can't be found or are undergoing treatment are skipped with a message.
+        """
+        if self.__role != "Zookeeper":
+            raise PermissionError("only Zookeepers are able to feed the animals.")
+        if isinstance(feed_plan, str):
+            if not feed_plan.strip():
+                raise ValueError("Food cannot be an empty string.")
+            plan = ((name, feed_plan) for name in list(self.__assigned_animals))
+        else:
+            plan = feed_plan.items()
+        return self.__feeding_round(plan, animal_index)
+
+    def __feeding_round(self, plan, animal_index):
+        """
+        Private generator behind feeding_round, each name is checked against the assignment set.
+        """
+        assigned = self.__assigned_animals
+        for name, food in plan:
+            if name not in assigned:
+                yield f"{name} is not assigned to {self.__name}."
+                continue
+            animal = animal_index.get(name)
+            if animal is None:
+                yield f"{name} could not be found."
+                continue
+            if animal.under_treatment:
+                yield f"{animal.name} is undergoing treatment, and should not be fed without vet approval."
+                continue
+            yield animal.eat(food)
+
     def clean_enclosure(self, enclosure):
         """
         Cleaning an enclosure is done by zookeepers.
@@ -123,6 +337,8 @@ class Staff:
             raise ValueError("severity must be an integer between 1-10.")
         record = self.__create_health_record(description.strip(), severity, treatment_notes.strip())
         animal.add_health_record(record)
+        if self.__journal is not None:
+            self.__journal.append(animal.name, record)
         return f"{self.__name} added health record to {animal.name} with severity of {severity}."
 
     # --------------------------- Private Helpers ---------------------------
@@ -133,9 +349,77 @@ class Staff:
         """
         return HealthRecord(description, date.today(), severity, treatment_notes)
 
+    # --------------------------- Persistence Helpers ---------------------------
+    @classmethod
+    def _restore(cls, staff_id, name, role, animals=(), enclosures=(), trusted=False):
+        """
+        Rebuild a Staff member and their assignments loaded by the persistence layer.
+        Untrusted data goes through __validate_init and the assignment name checks, trusted data skips them
+        and is built by from_trusted_rows.
+        """
+        if trusted:
+            return cls.from_trusted_rows(((staff_id, name, role, animals, enclosures),))[0]
+        staff = cls(staff_id, name, role)
+        for animal_name in animals:
+            if not isinstance(animal_name, str) or not animal_name.strip():
+                raise ValueError("animal name cannot be an empty string.")
+            staff.__assigned_animals[animal_name] = None
+        for enclosure_name in enclosures:
+            staff.assign_enclosure(enclosure_name)
+        return staff
+
+    # --------------------------- Bulk Construction ---------------------------
+    @classmethod
+    def validate_rows(cls, rows):
+        """
+        Checks every (staff_id, name, role) row in one pass.
+        Returns a list of (row index, error message) for every bad row, empty if all are valid.
+        """
+        return _row_errors(cls.__validate_init, rows)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Builds staff members from untrusted (staff_id, name, role) rows.
+        Every row is checked before anyone is built, a ValueError lists all the bad rows at once.
+        """
+        rows = list(rows)
+        _raise_row_errors(cls.validate_rows(rows), "staff")
+        return cls.from_trusted_rows(rows)
+
+    @classmethod
+    def from_trusted_rows(cls, rows):
+        """
+        Builds staff members from already validated rows without any checks.
+        Each row holds the _restore arguments: (staff_id, name, role[, animals[, enclosures]]).
+        The fields are set in the loop to avoid a call per row, _restore(trusted=True) builds through here too
+        so this is the only place outside __init__ that sets them up.
+        """
+        new = cls.__new__
+        members = []
+        for row in rows:
+            staff = new(cls)
+            staff.__staff_id = row[0]
+            staff.__name = row[1]
+            staff.__role = row[2]
+            staff.__assigned_animals = dict.fromkeys(row[3]) if len(row) > 3 else {}
+            staff.__assigned_enclosures = dict.fromkeys(row[4]) if len(row) > 4 else {}
+            staff.__index = None
+            staff.__lock = threading.RLock()
+            staff.__journal = None
+            members.append(staff)
+        return members
+
+    @classmethod
+    def from_trusted_columns(cls, staff_ids, names, roles):
+        """
+        Builds staff members from already validated columns of equal length.
+        """
+        return cls.from_trusted_rows(zip(staff_ids, names, roles))
+
     def __str__(self):
         """
         Summary to help with demonstrations and testing.
         Readable view.
         """
-        return f"{self.__name} ({self.__role}) - Animals: {self.__assigned_animals} | Enclosures: {self.__assigned_enclosures}"
\ No newline at end of file
+        return format_staff_summary(self.__name, self.__role, self.__assigned_animals, self.__assigned_enclosures)
\ No newline at end of file
@@ -0,0 +1,79 @@
+'''
+File: triage.py
+Description: This triage file sweeps many animals at once against a rule like "highest severity in the last N days
+is at least a threshold", then sets or clears their treatment flags in one batch and reports what changed.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing datetime.date and timedelta to work out the start of the window of days.
+"""
+from datetime import date, timedelta
+
+# --------------------------- Evaluation ---------------------------
+def _window(days, today):
+    """
+    Private helper returning the (since, until) dates of the last days days, both inclusive and ending today.
+    """
+    if not isinstance(days, int) or days <= 0:
+        raise ValueError("days must be a positive integer.")
+    today = date.today() if today is None else today
+    if not isinstance(today, date):
+        raise ValueError("today must be a date.")
+    return today - timedelta(days=days - 1), today
+
+def max_severities(animals, days, today=None, store=None):
+    """
+    Returns a list with the highest severity recorded for each animal in the last days days, 0 if none.
+    When a HealthRecordStore is given, animals registered in it are evaluated from its columns in one pass
+    (with NumPy if installed), any others use a binary search of their own sorted records.
+    """
+    since, until = _window(days, today)
+    from_store = store.max_severity_by_animal(since, until) if store is not None else {}
+    result = []
+    for animal in animals:
+        if store is not None and animal in store:
+            result.append(from_store.get(animal, 0))
+        else:
+            result.append(max((r.severity for r in animal.get_health_records(since, until)), default=0))
+    return result
+
+def plan_triage(animals, days, threshold, today=None, store=None, clear=True):
+    """
+    Works out which treatment flags the rule would change without changing anything.
+    An animal is flagged when its highest severity in the last days days is at least threshold, and
+    when clear is True a flagged animal below the threshold is cleared.
+    Returns {"flag": [Animal, ...], "clear": [Animal, ...]} in the order the animals were given.
+    """
+    if not isinstance(threshold, int) or not (1 <= threshold <= 10):
+        raise ValueError("threshold must be an integer between 1 and 10.")
+    animals = list(animals)
+    plan = {"flag": [], "clear": []}
+    for animal, severity in zip(animals, max_severities(animals, days, today, store)):
+        if severity >= threshold:
+            if not animal.under_treatment:
+                plan["flag"].append(animal)
+        elif clear and animal.under_treatment:
+            plan["clear"].append(animal)
+    return plan
+
+# --------------------------- Applying ---------------------------
+def apply_triage(plan):
+    """
+    Applies a plan from plan_triage in one batch and returns the same plan, which is the set of changed animals.
+    """
+    for animal in plan["flag"]:
+        animal.flag_treatment()
+    for animal in plan["clear"]:
+        animal.clear_treatment()
+    return plan
+
+def triage(animals, days, threshold, today=None, store=None, clear=True):
+    """
+    Evaluates the rule for every animal and applies the flag changes in one batch.
+    Returns {"flag": [...], "clear": [...]} with the animals whose flag changed.
+    """
+    return apply_triage(plan_triage(animals, days, threshold, today, store, clear))
@@ -0,0 +1,404 @@
+'''
+File: zoo.py
+Description: This class Zoo file is the top level registry that owns the animals, enclosures and staff. It keeps
+secondary indexes up to date on every change so common questions can be answered without scanning the whole zoo.
+Author: Emily Chuong
+ID: 110448094
+Username: chuey008
+This is my own work as defined by the University's Academic Integrity Policy.
+'''
+
+"""
+Importing weakref so the event bus doesn't keep a zoo alive after it is no longer used.
+Built in dict generics are used for type hints for the registries and indexes, so typing is not imported.
+Dictionaries are used as insertion ordered sets so results come back in the order they were added.
+"""
+import weakref
+from animal import Animal
+from dashboard import ZooDashboard
+from enclosure import Enclosure
+from errors import DuplicateError, Rejection
+from events import (bus, AnimalAdded, AnimalRemoved, EnclosureCleaned, EnclosureDecayed, HealthRecordAdded,
+                    TreatmentCleared, TreatmentFlagged)
+from staff import AssignmentIndex, Staff
+
+# events that can change an animal's treatment flag or an enclosure's occupancy and cleanliness
+TREATMENT_EVENTS = (HealthRecordAdded, TreatmentCleared, TreatmentFlagged)
+ENCLOSURE_EVENTS = (AnimalAdded, AnimalRemoved, EnclosureCleaned, EnclosureDecayed)
+
+def _unsubscribe(handler):
+    """
+    Private helper run when a zoo is garbage collected, to take its handler off the event bus.
+    """
+    for event_type in TREATMENT_EVENTS + ENCLOSURE_EVENTS:
+        bus.unsubscribe(handler, event_type)
+
+class Zoo:
+    """
+    This class represents the zoo as a whole and is the single place where state is changed.
+    Animals and enclosures are keyed by name and staff by staff_id.
+    Indexes kept for: species, animal subclass, enclosure, under_treatment and assigned staff.
+    A ZooDashboard of zoo-wide totals is kept as well.
+    The under_treatment index and the dashboard follow the mutation events on the event bus, so they stay correct
+    for changes made directly on the objects (e.g. by the simulation, the scheduler or placement.apply_plan).
+    In BUFFERED mode they catch up when the bus is flushed.
+    Registration and placement should go through the Zoo so the other indexes stay in sync with the objects.
+    """
+    def __init__(self, name):
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("name cannot be an empty string.")
+        self.__name = name
+        self.__animals: dict[str, Animal] = {}
+        self.__enclosures: dict[str, Enclosure] = {}
+        self.__staff: dict[str, Staff] = {}
+
+        # secondary indexes
+        self.__by_species: dict[str, dict[str, Animal]] = {}
+        self.__by_type: dict[type, dict[str, Animal]] = {}
+        self.__enclosure_of: dict[str, str] = {}  # animal name -> enclosure name
+        self.__under_treatment: dict[str, Animal] = {}
+        self.__assignments = AssignmentIndex()  # shared with every registered staff member
+        self.__dashboard = ZooDashboard()
+        self.__subscribe()
+
+    # --------------------------- Private Helpers ---------------------------
+    def __require(self, registry, key, label):
+        """
+        Private helper to look up a registered object and raise a ValueError if it is missing.
+        """
+        try:
+            return registry[key]
+        except KeyError:
+            raise ValueError(f"{label} {key} is not registered in the zoo.") from None
+
+    def __subscribe(self):
+        """
+        Private helper to subscribe the under_treatment index and the dashboard to the event bus.
+        The handler only holds a weak reference to the zoo and is unsubscribed when the zoo is garbage collected.
+        """
+        zoo = weakref.ref(self)
+
+        def on_event(event):
+            owner = zoo()
+            if owner is not None:
+                owner.__on_event(event)
+
+        for event_type in TREATMENT_EVENTS + ENCLOSURE_EVENTS:
+            bus.subscribe(on_event, event_type)
+        weakref.finalize(self, _unsubscribe, on_event)
+
+    def __on_event(self, event):
+        """
+        Private helper to apply one event, events about animals that are not registered here are ignored.
+        """
+        if type(event) in TREATMENT_EVENTS:
+            animal = event.animal
+            if self.__animals.get(animal.name) is animal:
+                self.__refresh_treatment(animal)
+        else:
+            self.__dashboard.on_event(event)
+
+    def __refresh_treatment(self, animal):
+        """
+        Private helper to keep the under_treatment index in line with the animal's flag.
+        """
+        if animal.under_treatment:
+            self.__under_treatment[animal.name] = animal
+        else:
+            self.__under_treatment.pop(animal.name, None)
+        self.__dashboard.refresh_animal(animal)
+
+    # --------------------------- Public Properties ---------------------------
+    @property
+    def name(self):
+        # name of the zoo
+        return self.__name
+
+    @property
+    def dashboard(self):
+        # cached zoo-wide totals, kept up to date from the event bus
+        return self.__dashboard
+
+    # --------------------------- Registration ---------------------------
+    def add_animal(self, animal):
+        """
+        Register an animal with the zoo, names must be unique.
+        """
+        if not isinstance(animal, Animal):
+            raise TypeError("animal must be an Animal instance.")
+        if animal.name in self.__animals:
+            raise ValueError(f"Animal named {animal.name} is already registered in the zoo.")
+        self.__animals[animal.name] = animal
+        self.__by_species.setdefault(animal.species, {})[animal.name] = animal
+        self.__by_type.setdefault(type(animal), {})[animal.name] = animal
+        self.__refresh_treatment(animal)
+
+    def remove_animal(self, animal_name):
+        """
+        Remove an animal from the zoo and its enclosure, returning the removed Animal object.
+        """
+        animal = self.__require(self.__animals, animal_name, "Animal")
+        if animal_name in self.__enclosure_of:
+            self.remove_from_enclosure(animal_name)
+        del self.__animals[animal_name]
+        for index, key in ((self.__by_species, animal.species), (self.__by_type, type(animal))):
+            bucket = index[key]
+            del bucket[animal_name]
+            if not bucket:
+                del index[key]
+        self.__under_treatment.pop(animal_name, None)
+        self.__dashboard.forget_animal(animal)
+        for staff in self.__assignments.staff_for_animal(animal_name):
+            staff.unassign_animal(animal_name)
+        return animal
+
+    def add_enclosure(self, enclosure):
+        """
+        Register an enclosure with the zoo, names must be unique.
+        Any animals already inside the enclosure must be registered first.
+        """
+        if not isinstance(enclosure, Enclosure):
+            raise TypeError("enclosure must be an Enclosure instance.")
+        if enclosure.name in self.__enclosures:
+            raise ValueError(f"Enclosure named {enclosure.name} is already registered in the zoo.")
+        names = enclosure.animal_names()
+        for animal_name in names:
+            self.__require(self.__animals, animal_name, "Animal")
+            if animal_name in self.__enclosure_of:
+                raise ValueError(f"Animal named {animal_name} is already placed in another enclosure.")
+        self.__enclosures[enclosure.name] = enclosure
+        for animal_name in names:
+            self.__enclosure_of[animal_name] = enclosure.name
+        self.__dashboard.track_enclosure(enclosure)
+
+    def add_staff(self, staff):
+        """
+        Register a staff member with the zoo, staff ids must be unique.
+        The staff member is attached to the zoo's AssignmentIndex, so existing and future assignments are indexed.
+        """
+        if not isinstance(staff, Staff):
+            raise TypeError("staff must be a Staff instance.")
+        if staff.staff_id in self.__staff:
+            raise ValueError(f"Staff ID {staff.staff_id} is already registered in the zoo.")
+        staff.attach_index(self.__assignments)
+        self.__staff[staff.staff_id] = staff
+
+    # --------------------------- Mutations ---------------------------
+    def place_animal(self, animal_name, enclosure_name):
+        """
+        Place a registered animal into a registered enclosure.
+        An animal can only be in one enclosure at a time, Enclosure.add_animal does the remaining checks.
+        """
+        animal = self.__require(self.__animals, animal_name, "Animal")
+        enclosure = self.__require(self.__enclosures, enclosure_name, "Enclosure")
+        if animal_name in self.__enclosure_of:
+            raise ValueError(f"Animal named {animal_name} is already placed in {self.__enclosure_of[animal_name]}.")
+        enclosure.add_animal(animal)
+        self.__enclosure_of[animal_name] = enclosure_name
+
+    def place_animals(self, animal_names, enclosure_name):
+        """
+        Place many registered animals into one registered enclosure with Enclosure.add_animals (all-or-nothing).
+        Animals already placed in an enclosure are rejected in the report.
+        Returns the add_animals report.
+        """
+        enclosure = self.__require(self.__enclosures, enclosure_name, "Enclosure")
+        batch = []
+        placed = []
+        for animal_name in animal_names:
+            animal = self.__require(self.__animals, animal_name, "Animal")
+            if animal_name in self.__enclosure_of:
+                placed.append((animal, Rejection(f"Animal named {animal_name} is already placed in "
+                                                 f"{self.__enclosure_of[animal_name]}.", DuplicateError.reason)))
+            else:
+                batch.append(animal)
+        if placed:
+            return {"added": [], "rejected": placed}
+        report = enclosure.add_animals(batch)
+        for animal in report["added"]:
+            self.__enclosure_of[animal.name] = enclosure_name
+        return report
+
+    def remove_from_enclosure(self, animal_name):
+        """
+        Take an animal out of its enclosure, the animal stays registered in the zoo.
+        Returns the removed Animal object.
+        """
+        enclosure_name = self.__enclosure_of.get(animal_name)
+        if enclosure_name is None:
+            raise ValueError(f"Animal named {animal_name} is not placed in an enclosure.")
+        enclosure = self.__enclosures[enclosure_name]
+        animal = enclosure.remove_animal(animal_name)
+        del self.__enclosure_of[animal_name]
+        return animal
+
+    def clean_enclosure(self, staff_id, enclosure_name):
+        """
+        Delegates cleaning a registered enclosure to the staff member.
+        """
+        staff = self.__require(self.__staff, staff_id, "Staff ID")
+        enclosure = self.__require(self.__enclosures, enclosure_name, "Enclosure")
+        return staff.clean_enclosure(enclosure)
+
+    def perform_health_check(self, staff_id, animal_name, description, severity, treatment_notes=""):
+        """
+        Delegates a health check to the staff member, the under_treatment index follows the HealthRecordAdded event.
+        """
+        staff = self.__require(self.__staff, staff_id, "Staff ID")
+        animal = self.__require(self.__animals, animal_name, "Animal")
+        return staff.perform_health_check(animal, description, severity, treatment_notes)
+
+    def feeding_round(self, staff_id, feed_plan):
+        """
+        Delegates a feeding round to the staff member, resolving animal names through the zoo registry.
+        Returns the generator from Staff.feeding_round.
+        """
+        staff = self.__require(self.__staff, staff_id, "Staff ID")
+        return staff.feeding_round(feed_plan, self.__animals)
+
+    def clear_treatment(self, animal_name):
+        """
+        Clears the animal's treatment flag, the under_treatment index follows the TreatmentCleared event.
+        """
+        self.__require(self.__animals, animal_name, "Animal").clear_treatment()
+
+    def triage(self, days, threshold, today=None, store=None, clear=True):
+        """
+        Sweeps every registered animal with triage.triage: animals whose highest severity in the last days days
+        is at least threshold are flagged, and flagged animals below it are cleared if clear is True.
+        Only the changed animals emit events, so only they are refreshed in the treatment index and dashboard.
+        Returns {"flag": [Animal, ...], "clear": [Animal, ...]} with the animals whose flag changed.
+        """
+        from triage import triage  # analytics are only imported when first used
+        return triage(self.__animals.values(), days, threshold, today, store, clear)
+
+    def assign_animal(self, staff_id, animal_name):
+        """
+        Assign a registered animal to a registered staff member.
+        """
+        staff = self.__require(self.__staff, staff_id, "Staff ID")
+        animal = self.__require(self.__animals, animal_name, "Animal")
+        staff.assign_animal(animal)
+
+    def assign_enclosure(self, staff_id, enclosure_name):
+        """
+        Assign a registered enclosure to a registered staff member.
+        """
+        staff = self.__require(self.__staff, staff_id, "Staff ID")
+        self.__require(self.__enclosures, enclosure_name, "Enclosure")
+        staff.assign_enclosure(enclosure_name)
+
+    def unassign_animal(self, staff_id, animal_name):
+        """
+        Remove an animal from a registered staff member.
+        """
+        self.__require(self.__staff, staff_id, "Staff ID").unassign_animal(animal_name)
+
+    def unassign_enclosure(self, staff_id, enclosure_name):
+        """
+        Remove an enclosure from a registered staff member.
+        """
+        self.__require(self.__staff, staff_id, "Staff ID").unassign_enclosure(enclosure_name)
+
+    # --------------------------- Lookups ---------------------------
+    def get_animal(self, animal_name):
+        """
+        Returns the registered Animal object with the given name.
+        """
+        return self.__require(self.__animals, animal_name, "Animal")
+
+    def get_enclosure(self, enclosure_name):
+        """
+        Returns the registered Enclosure object with the given name.
+        """
+        return self.__require(self.__enclosures, enclosure_name, "Enclosure")
+
+    def get_staff(self, staff_id):
+        """
+        Returns the registered Staff object with the given staff_id.
+        """
+        return self.__require(self.__staff, staff_id, "Staff ID")
+
+    def animals(self):
+        """
+        Returns all registered animals in the order they were added.
+        """
+        return list(self.__animals.values())
+
+    def enclosures(self):
+        """
+        Returns all registered enclosures in the order they were added.
+        """
+        return list(self.__enclosures.values())
+
+    def staff(self):
+        """
+        Returns all registered staff in the order they were added.
+        """
+        return list(self.__staff.values())
+
+    # --------------------------- Index Queries ---------------------------
+    def animals_by_species(self, species):
+        """
+        Returns the animals of the given species, species is matched in lower case like Animal.species.
+        """
+        return list(self.__by_species.get(species.lower(), {}).values())
+
+    def animals_by_type(self, animal_type):
+        """
+        Returns the animals created from exactly the given subclass e.g. Mammal, Bird, Reptile or Other.
+        """
+        return list(self.__by_type.get(animal_type, {}).values())
+
+    def animals_under_treatment(self):
+        """
+        Returns the animals currently flagged as undergoing treatment.
+        """
+        return list(self.__under_treatment.values())
+
+    def enclosure_of(self, animal_name):
+        """
+        Returns the enclosure holding the animal, or None if it is not placed.
+        """
+        enclosure_name = self.__enclosure_of.get(animal_name)
+        return None if enclosure_name is None else self.__enclosures[enclosure_name]
+
+    def animals_in(self, enclosure_name):
+        """
+        Returns the animals housed in the given enclosure.
+        """
+        enclosure = self.__require(self.__enclosures, enclosure_name, "Enclosure")
+        return [self.__animals[n] for n in enclosure.animal_names()]
+
+    def animals_for_staff(self, staff_id):
+        """
+        Returns the registered animals assigned to the given staff member.
+        """
+        staff = self.__require(self.__staff, staff_id, "Staff ID")
+        return [self.__animals[n] for n in staff.assigned_animals if n in self.__animals]
+
+    def staff_for_animal(self, animal_name):
+        """
+        Returns the staff members assigned to the given animal.
+        """
+        return self.__assignments.staff_for_animal(animal_name)
+
+    def staff_for_enclosure(self, enclosure_name):
+        """
+        Returns the staff members assigned to the given enclosure.
+        """
+        return self.__assignments.staff_for_enclosure(enclosure_name)
+
+    def verify_dashboard(self):
+        """
+        Recomputes the dashboard from scratch and returns a list of mismatches, empty if the cache is correct.
+        In BUFFERED mode events that haven't been flushed yet will show up here.
+        """
+        return self.__dashboard.verify(self.__enclosures.values(), self.__animals.values())
+
+    def __str__(self):
+        """
+        Summary of the zoo for demonstrations.
+        """
+        return (f"Zoo '{self.__name}': {len(self.__animals)} animals; {len(self.__enclosures)} enclosures; "
+                f"{len(self.__staff)} staff; {len(self.__under_treatment)} under treatment")